@@ -314,6 +314,7 @@ class InbreedingCalculator:
     def __init__(self, registry):
         self.registry = registry
         self._coefficient_cache = {}
+        self._cache_version = registry.version
     
     def calculate_coefficient(self, cat_id: int) -> float:
         """
@@ -322,6 +323,10 @@ class InbreedingCalculator:
         Returns:
             Inbreeding coefficient (0 = no inbreeding, 1 = maximum)
         """
+        # Edits made outside the event bus still bump the registry version
+        if self._cache_version != self.registry.version:
+            self._coefficient_cache.clear()
+            self._cache_version = self.registry.version
         if cat_id in self._coefficient_cache:
             return self._coefficient_cache[cat_id]
         
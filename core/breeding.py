@@ -3,7 +3,7 @@ Breeding logic for generating offspring from parent cats
 """
 
 import random
-from typing import List
+from typing import Dict, List, Optional
 from core.cat import Cat
 
 
@@ -14,17 +14,19 @@ class BreedingEngine:
         self.genetics = genetics_engine
     
     def breed_cats(self, sire: Cat, dam: Cat, litter_size: int, 
-                   rarity_boost: float = 1.0) -> List[Cat]:
-        """Generate a litter of kittens from two parent cats"""
+                   rarity_boost: float = 1.0, gene_table: Optional[Dict] = None) -> List[Cat]:
+        """Generate a litter of kittens from two parent cats, optionally from a snapshot of the gene table"""
+        if gene_table is None:
+            gene_table = self.genetics.genes
         litter = []
         
         for _ in range(litter_size):
             sex = random.choice(['male', 'female'])
-            genes = self._inherit_genes(sire, dam, sex)
+            genes = self._inherit_genes(sire, dam, sex, gene_table)
             
             # Apply rarity mutations
             if rarity_boost > 1.0:
-                genes = self._apply_rarity_mutations(genes, rarity_boost)
+                genes = self._apply_rarity_mutations(genes, rarity_boost, gene_table)
             
             # Calculate build and size with inheritance
             kitten_build = self._calculate_build(sire, dam)
@@ -43,11 +45,14 @@ class BreedingEngine:
         
         return litter
     
-    def _inherit_genes(self, sire: Cat, dam: Cat, offspring_sex: str) -> dict:
+    def _inherit_genes(self, sire: Cat, dam: Cat, offspring_sex: str,
+                       gene_table: Optional[Dict] = None) -> dict:
         """Inherit genes from both parents following Mendelian genetics"""
         genes = {}
+        if gene_table is None:
+            gene_table = self.genetics.genes
         
-        for gene_name, gene_data in self.genetics.genes.items():
+        for gene_name, gene_data in gene_table.items():
             # Skip quantitative traits handled separately
             if gene_name in ['build', 'size']:
                 continue
@@ -76,12 +81,15 @@ class BreedingEngine:
         
         return genes
     
-    def _apply_rarity_mutations(self, genes: dict, rarity_boost: float) -> dict:
+    def _apply_rarity_mutations(self, genes: dict, rarity_boost: float,
+                                gene_table: Optional[Dict] = None) -> dict:
         """Apply random mutations to create rarer alleles"""
         mutation_probability = min(0.4, (rarity_boost - 1.0) / 4.0)
+        if gene_table is None:
+            gene_table = self.genetics.genes
         
         for gene_name, allele_pair in genes.items():
-            gene_data = self.genetics.genes.get(gene_name, {})
+            gene_data = gene_table.get(gene_name, {})
             weights = [gene_data['weights'].get(a, 1) for a in gene_data['alleles']]
             
             # Invert weights to favor rare alleles
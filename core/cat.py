@@ -1534,7 +1534,9 @@ Cat model class representing a single cat with genetics and phenotype
 """
 
 import random
+import sys
 from datetime import datetime
+from functools import cached_property
 from typing import Dict, List, Optional, Tuple
 
 
@@ -1574,6 +1576,7 @@ class Cat:
         self._white_percentage = white_percentage
         self._phenotype_cache = None
         self._eye_color_cache = None
+        self._phenotype_version = None
     
     def _generate_random_build(self) -> int:
         """Generate random build value weighted toward average (46-55)"""
@@ -1585,6 +1588,11 @@ class Cat:
     
     def get_build_phenotype(self) -> str:
         """Map hidden build value (0-100) to phenotype category"""
+        return self.build_phenotype
+    
+    @cached_property
+    def build_phenotype(self) -> str:
+        """Build phenotype category, computed once per cat"""
         if self.build_value <= 15:
             return "Extreme Cobby"
         elif self.build_value <= 30:
@@ -1602,6 +1610,11 @@ class Cat:
     
     def get_size_phenotype(self) -> str:
         """Map hidden size value (0-100) to phenotype category"""
+        return self.size_phenotype
+    
+    @cached_property
+    def size_phenotype(self) -> str:
+        """Size phenotype category, computed once per cat"""
         if self.size_value <= 20:
             return "Toy"
         elif self.size_value <= 40:
@@ -1618,6 +1631,8 @@ class Cat:
         self._phenotype_cache = None
         self._eye_color_cache = None
         self._white_percentage = None
+        self.__dict__.pop('build_phenotype', None)
+        self.__dict__.pop('size_phenotype', None)
     
     def to_dict(self) -> Dict:
         """Convert cat to dictionary for JSON serialization"""
@@ -1634,6 +1649,12 @@ class Cat:
             'white_percentage': self._white_percentage
         }
     
+    @staticmethod
+    def intern_genes(genes: Dict[str, List[str]]) -> Dict[str, List[str]]:
+        """Share gene and allele strings across all loaded cats"""
+        return {sys.intern(gene): [sys.intern(a) for a in alleles]
+                for gene, alleles in genes.items()}
+    
     @classmethod
     def from_dict(cls, data: Dict) -> 'Cat':
         """Create cat from dictionary"""
@@ -1641,7 +1662,7 @@ class Cat:
             cat_id=data['id'],
             name=data.get('name', ''),
             sex=data['sex'],
-            genes=data['genes'],
+            genes=cls.intern_genes(data['genes']),
             birth_date=data.get('birth_date'),
             sire_id=data.get('sire_id'),
             dam_id=data.get('dam_id'),
@@ -2,9 +2,10 @@
 Genetics engine for loading gene definitions and calculating dominance
 """
 
-import json
+from itertools import accumulate
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, FrozenSet, Iterable, List, Optional, Tuple
+from utils import json_compat
 
 
 class GeneticsEngine:
@@ -16,20 +17,28 @@ class GeneticsEngine:
         self.interactions_path = Path(interactions_path)
         self.genes: Dict = {}
         self.interactions: Dict = {}
+        self.version = 0
+        self._description_cache: Dict[Tuple, str] = {}
+        self._description_version = None
+        self._x_linked_genes: FrozenSet[str] = frozenset()
+        self._x_linked_version = None
+        self._sampling_tables: Tuple = ()
+        self._sampling_version = None
         self.load_data()
     
     def load_data(self):
         """Load gene definitions and interactions from JSON files"""
+        self.version += 1
         try:
             if self.genes_path.exists():
-                with open(self.genes_path, 'r') as f:
-                    self.genes = json.load(f)
+                with open(self.genes_path, 'rb') as f:
+                    self.genes = json_compat.loads(f.read())
             else:
                 print(f"Warning: {self.genes_path} not found. Using empty gene set.")
                 
             if self.interactions_path.exists():
-                with open(self.interactions_path, 'r') as f:
-                    self.interactions = json.load(f)
+                with open(self.interactions_path, 'rb') as f:
+                    self.interactions = json_compat.loads(f.read())
             else:
                 print(f"Warning: {self.interactions_path} not found.")
         except Exception as e:
@@ -38,14 +47,14 @@ class GeneticsEngine:
     def save_genes(self):
         """Save gene definitions to JSON file"""
         self.genes_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(self.genes_path, 'w') as f:
-            json.dump(self.genes, f, indent=2)
+        with open(self.genes_path, 'w', encoding='utf-8') as f:
+            f.write(json_compat.dumps(self.genes, indent=True))
     
     def save_interactions(self):
         """Save interaction rules to JSON file"""
         self.interactions_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(self.interactions_path, 'w') as f:
-            json.dump(self.interactions, f, indent=2)
+        with open(self.interactions_path, 'w', encoding='utf-8') as f:
+            f.write(json_compat.dumps(self.interactions, indent=True))
     
     def get_dominant_allele(self, gene_name: str, alleles: List[str]) -> str:
         """Determine which allele is dominant"""
@@ -66,11 +75,68 @@ class GeneticsEngine:
         gene = self.genes.get(gene_name, {})
         return gene.get('descriptions', {}).get(allele, allele)
     
+    def describe_alleles(self, gene_name: str, alleles: Tuple[str, ...], sep: str = ", ") -> str:
+        """Get the joined descriptions of a gene's alleles, cached until the gene data changes"""
+        if self._description_version != self.version:
+            self._description_cache.clear()
+            self._description_version = self.version
+        key = (gene_name, alleles, sep)
+        text = self._description_cache.get(key)
+        if text is None:
+            descriptions = self.genes.get(gene_name, {}).get('descriptions', {})
+            text = sep.join([descriptions.get(a, a) for a in alleles])
+            self._description_cache[key] = text
+        return text
+    
+    def get_display_bundle(self, genes: Dict[str, List[str]],
+                           gene_ids: Iterable[str]) -> List[Tuple[str, str, str, str]]:
+        """Get (gene id, display name, allele text, description) for each known gene present"""
+        bundle = []
+        for gene_id in gene_ids:
+            alleles = genes.get(gene_id)
+            gene = self.genes.get(gene_id)
+            if not alleles or not gene:
+                continue
+            
+            if len(alleles) == 1:
+                allele = alleles[0]
+                bundle.append((gene_id, gene['name'], allele, self.describe_alleles(gene_id, (allele,))))
+            else:
+                # Dominant allele first
+                dom = gene.get('dominance', {})
+                if len(alleles) == 2:
+                    a0, a1 = alleles
+                    ordered = (a1, a0) if dom.get(a0, 0) < dom.get(a1, 0) else (a0, a1)
+                else:
+                    ordered = tuple(sorted(alleles, key=lambda a: dom.get(a, 0), reverse=True))
+                bundle.append((gene_id, gene['name'], "/".join(ordered),
+                               self.describe_alleles(gene_id, ordered)))
+        return bundle
+    
     def is_x_linked(self, gene_name: str) -> bool:
         """Check if a gene is X-linked"""
         gene = self.genes.get(gene_name, {})
         return gene.get('x_linked', False)
     
+    def get_x_linked_genes(self) -> FrozenSet[str]:
+        """Get the names of all X-linked genes, cached until the gene data changes"""
+        if self._x_linked_version != self.version:
+            self._x_linked_genes = frozenset(
+                gene_id for gene_id, gene in self.genes.items() if gene.get('x_linked'))
+            self._x_linked_version = self.version
+        return self._x_linked_genes
+    
+    def get_sampling_tables(self) -> Tuple[Tuple[str, List[str], List[float], bool], ...]:
+        """Get (gene, alleles, cumulative weights, x-linked) rows, cached until the gene data changes"""
+        if self._sampling_version != self.version:
+            self._sampling_tables = tuple(
+                (gene_id, gene['alleles'],
+                 list(accumulate(gene['weights'].get(a, 1) for a in gene['alleles'])),
+                 gene.get('x_linked', False))
+                for gene_id, gene in self.genes.items())
+            self._sampling_version = self.version
+        return self._sampling_tables
+    
     def get_all_gene_names(self) -> List[str]:
         """Get list of all gene names"""
         return list(self.genes.keys())
@@ -78,13 +144,16 @@ class GeneticsEngine:
     def add_gene(self, gene_id: str, gene_data: Dict):
         """Add a new gene definition"""
         self.genes[gene_id] = gene_data
+        self.version += 1
     
     def remove_gene(self, gene_id: str):
         """Remove a gene definition"""
         if gene_id in self.genes:
             del self.genes[gene_id]
+            self.version += 1
     
     def update_gene(self, gene_id: str, gene_data: Dict):
         """Update an existing gene definition"""
         if gene_id in self.genes:
-            self.genes[gene_id] = gene_data
\ No newline at end of file
+            self.genes[gene_id] = gene_data
+            self.version += 1
\ No newline at end of file
@@ -3,9 +3,20 @@ Phenotype calculation logic - determines visible traits from genetics
 """
 
 import random
+from dataclasses import dataclass
 from typing import Dict, List, Tuple
 
 
+@dataclass(slots=True)
+class CatPhenoView:
+    """All displayed traits of a cat"""
+    phenotype: str
+    eye_color: str
+    white_pct: int
+    build_pheno: str
+    size_pheno: str
+
+
 class PhenotypeCalculator:
     """Calculates phenotype from genotype"""
     
@@ -45,6 +56,50 @@ class PhenotypeCalculator:
         
         return ' '.join(parts)
     
+    def _check_cache(self, cat):
+        """Drop a cat's cached phenotype and eye color if the gene data changed since they were computed"""
+        version = self.genetics.version
+        if cat._phenotype_version != version:
+            cat._phenotype_cache = None
+            cat._eye_color_cache = None
+            cat._phenotype_version = version
+    
+    def calculate_phenotypes(self, cats) -> Dict[int, str]:
+        """Calculate phenotypes for many cats at once, keyed by cat id"""
+        phenotypes = {}
+        check_cache = self._check_cache
+        for cat in cats:
+            check_cache(cat)
+            if cat._phenotype_cache is None:
+                cat._phenotype_cache = self.calculate_phenotype(cat)
+            phenotypes[cat.id] = cat._phenotype_cache
+        return phenotypes
+    
+    def phenotype_and_eye_color(self, cat) -> Tuple[str, str]:
+        """Get a cat's phenotype and eye color, cached on the cat until its genes or the gene data change"""
+        self._check_cache(cat)
+        if cat._phenotype_cache is None:
+            cat._phenotype_cache = self.calculate_phenotype(cat)
+        if cat._eye_color_cache is None:
+            cat._eye_color_cache = self.calculate_eye_color(cat)
+        return cat._phenotype_cache, cat._eye_color_cache
+    
+    def compute_all(self, cat) -> CatPhenoView:
+        """Calculate every displayed trait of a cat in one call"""
+        self._check_cache(cat)
+        if cat._phenotype_cache is None:
+            cat._phenotype_cache = self.calculate_phenotype(cat)
+        if cat._eye_color_cache is None:
+            cat._eye_color_cache = self.calculate_eye_color(cat)
+        
+        return CatPhenoView(
+            phenotype=cat._phenotype_cache,
+            eye_color=cat._eye_color_cache,
+            white_pct=self.get_white_percentage(cat),
+            build_pheno=cat.get_build_phenotype(),
+            size_pheno=cat.get_size_phenotype()
+        )
+    
     def _get_red_expression(self, cat) -> str:
         """Determine red/orange expression"""
         red_alleles = cat.genes.get('red', ['o'])
@@ -238,6 +293,12 @@ class PhenotypeCalculator:
         
         return cat._white_percentage
     
+    def calculate_white_percentages(self, cats) -> List[int]:
+        """Calculate white percentages for many cats at once, in input order"""
+        get_white_percentage = self.get_white_percentage
+        return [cat._white_percentage if cat._white_percentage is not None
+                else get_white_percentage(cat) for cat in cats]
+    
     def get_white_description(self, cat) -> str:
         """Get descriptive white marking level"""
         pct = self.get_white_percentage(cat)
@@ -302,6 +363,17 @@ class PhenotypeCalculator:
         
         return self._calculate_polygenic_eye_color(cat)
     
+    def calculate_eye_colors(self, cats) -> List[str]:
+        """Calculate eye colors for many cats at once, in input order"""
+        eye_colors = []
+        check_cache = self._check_cache
+        for cat in cats:
+            check_cache(cat)
+            if cat._eye_color_cache is None:
+                cat._eye_color_cache = self.calculate_eye_color(cat)
+            eye_colors.append(cat._eye_color_cache)
+        return eye_colors
+    
     def _get_eye_pigment_score(self, cat) -> float:
         """Calculate melanin pigment score"""
         score = 0.0
@@ -158,7 +158,7 @@ class BreedingService:
         for sire in males:
             for dam in females:
                 # Skip if related
-                if self.breeding.check_relatedness(sire.id, dam.id, self.registry.cats):
+                if self.registry.check_relatedness(sire.id, dam.id):
                     continue
                 
                 # Calculate score
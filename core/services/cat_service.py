@@ -91,6 +91,7 @@ class CatService:
         # Invalidate caches
         cat.invalidate_cache()
         self._invalidate_cat_cache(cat_id)
+        self.registry.invalidate_ancestors()
         
         # Emit event
         self.events.emit(EventType.CAT_UPDATED, cat, source='CatService')
@@ -396,7 +396,7 @@ class DatabaseManager:
             cat_id=row['id'],
             name=row['name'],
             sex=row['sex'],
-            genes=json.loads(row['genes']),
+            genes=Cat.intern_genes(json.loads(row['genes'])),
             birth_date=row['birth_date'],
             sire_id=row['sire_id'],
             dam_id=row['dam_id'],
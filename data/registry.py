@@ -2,7 +2,8 @@
 Cat registry management - stores and manages all cats
 """
 
-from typing import Dict, List, Optional
+from itertools import islice
+from typing import Dict, FrozenSet, Iterable, List, Optional, Tuple
 from core.cat import Cat
 
 
@@ -13,6 +14,10 @@ class CatRegistry:
         self.cats: Dict[int, Cat] = {}
         self.next_id = 1
         self.current_file: Optional[str] = None
+        self.version = 0
+        self._ancestor_cache: Dict[Tuple[int, int], FrozenSet[int]] = {}
+        self._generation_cache: Dict[int, int] = {}
+        self._offspring_index: Optional[Dict[int, List[int]]] = None
     
     def add_cat(self, cat: Cat) -> int:
         """Add a cat to the registry and assign ID"""
@@ -23,12 +28,32 @@ class CatRegistry:
             self.next_id = max(self.next_id, cat.id + 1)
         
         self.cats[cat.id] = cat
+        self.invalidate_ancestors()
         return cat.id
     
+    def add_cats(self, cats: List[Cat]) -> List[int]:
+        """Add several cats to the registry in one pass and assign IDs"""
+        next_id = self.next_id
+        cat_ids = []
+        
+        for cat in cats:
+            if cat.id is None:
+                cat.id = next_id
+                next_id += 1
+            else:
+                next_id = max(next_id, cat.id + 1)
+            cat_ids.append(cat.id)
+        
+        self.cats.update((cat.id, cat) for cat in cats)
+        self.next_id = next_id
+        self.invalidate_ancestors()
+        return cat_ids
+    
     def remove_cat(self, cat_id: int) -> bool:
         """Remove a cat from the registry"""
         if cat_id in self.cats:
             del self.cats[cat_id]
+            self.invalidate_ancestors()
             return True
         return False
     
@@ -36,6 +61,11 @@ class CatRegistry:
         """Get a cat by ID"""
         return self.cats.get(cat_id)
     
+    def get_cats(self, cat_ids: Iterable[int]) -> Dict[int, Cat]:
+        """Get the registered cats among cat_ids in one call, keyed by ID"""
+        cats = self.cats
+        return {cat_id: cats[cat_id] for cat_id in cat_ids if cat_id in cats}
+    
     def get_all_cats(self) -> List[Cat]:
         """Get all cats as a list"""
         return list(self.cats.values())
@@ -48,10 +78,25 @@ class CatRegistry:
         """Get all female cats"""
         return [cat for cat in self.cats.values() if cat.sex == 'female']
     
-    def get_offspring(self, parent_id: int) -> List[Cat]:
-        """Get all offspring of a cat"""
-        return [cat for cat in self.cats.values() 
-                if cat.sire_id == parent_id or cat.dam_id == parent_id]
+    def _get_offspring_ids(self, parent_id: int) -> List[int]:
+        """Get offspring IDs from the parent -> children index, building it on first use"""
+        index = self._offspring_index
+        if index is None:
+            index = self._offspring_index = {}
+            for cat in self.cats.values():
+                for pid in {cat.sire_id, cat.dam_id}:
+                    if pid:
+                        index.setdefault(pid, []).append(cat.id)
+        return index.get(parent_id, [])
+    
+    def get_offspring(self, parent_id: int, limit: Optional[int] = None) -> List[Cat]:
+        """Get offspring of a cat, at most limit of them if given"""
+        cats = self.cats
+        return [cats[cid] for cid in islice(self._get_offspring_ids(parent_id), limit)]
+    
+    def count_offspring(self, parent_id: int) -> int:
+        """Count offspring of a cat without building a list"""
+        return len(self._get_offspring_ids(parent_id))
     
     def get_parents(self, cat_id: int) -> tuple:
         """Get both parents of a cat (sire, dam)"""
@@ -63,9 +108,82 @@ class CatRegistry:
         dam = self.get_cat(cat.dam_id) if cat.dam_id else None
         return sire, dam
     
+    def get_ancestors(self, cat_id: int, max_generations: int = 3) -> FrozenSet[int]:
+        """Get a cat and its registered ancestors within max_generations"""
+        key = (cat_id, max_generations)
+        ancestors = self._ancestor_cache.get(key)
+        if ancestors is not None:
+            return ancestors
+        
+        found = set()
+        level = [cat_id]
+        for _ in range(max_generations):
+            parents = []
+            for ancestor_id in level:
+                cat = self.cats.get(ancestor_id)
+                if cat is None:
+                    continue
+                found.add(ancestor_id)
+                if cat.sire_id:
+                    parents.append(cat.sire_id)
+                if cat.dam_id:
+                    parents.append(cat.dam_id)
+            level = parents
+        
+        ancestors = self._ancestor_cache[key] = frozenset(found)
+        return ancestors
+    
+    def check_relatedness(self, cat1_id: int, cat2_id: int, max_generations: int = 3) -> bool:
+        """Check if two cats share an ancestor within specified generations"""
+        shared = (self.get_ancestors(cat1_id, max_generations)
+                  & self.get_ancestors(cat2_id, max_generations))
+        return bool(shared - {cat1_id, cat2_id})
+    
+    def get_generation(self, cat_id: int) -> int:
+        """Get the number of generations of registered ancestry behind a cat"""
+        generations = self._generation_cache
+        if cat_id in generations:
+            return generations[cat_id]
+        
+        # Iterative post-order walk; each ancestor is resolved once
+        stack = [(cat_id, False)]
+        in_progress = set()
+        while stack:
+            current_id, expanded = stack.pop()
+            if current_id in generations:
+                continue
+            cat = self.cats.get(current_id)
+            if not cat or (not cat.sire_id and not cat.dam_id):
+                generations[current_id] = 0
+                continue
+            
+            parent_ids = [pid for pid in (cat.sire_id, cat.dam_id) if pid]
+            if not expanded:
+                in_progress.add(current_id)
+                stack.append((current_id, True))
+                stack.extend((pid, False) for pid in parent_ids
+                             if pid not in generations and pid not in in_progress)
+            else:
+                in_progress.discard(current_id)
+                generations[current_id] = max(generations.get(pid, 0) for pid in parent_ids) + 1
+        
+        return generations[cat_id]
+    
+    def mark_modified(self):
+        """Record an in-place edit to a registered cat"""
+        self.version += 1
+    
+    def invalidate_ancestors(self):
+        """Drop cached ancestor sets, generations and offspring after a cat's parents change"""
+        self.version += 1
+        self._ancestor_cache.clear()
+        self._generation_cache.clear()
+        self._offspring_index = None
+    
     def clear(self):
         """Clear all cats from registry"""
         self.cats.clear()
+        self.invalidate_ancestors()
         self.next_id = 1
         self.current_file = None
     
@@ -81,6 +199,7 @@ class CatRegistry:
             cat = Cat.from_dict(cat_data)
             self.cats[cat.id] = cat
             self.next_id = max(self.next_id, cat.id + 1)
+        self.invalidate_ancestors()
     
     def search_cats(self, query: str) -> List[Cat]:
         """Search cats by ID, name, or phenotype"""
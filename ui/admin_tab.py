@@ -3,11 +3,93 @@ Admin tab - gene configuration and management
 """
 
 from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel,
-                               QTableWidget, QTableWidgetItem, QPushButton,
-                               QMessageBox, QTextEdit, QDialog, QFormLayout,
-                               QLineEdit, QCheckBox, QGroupBox)
-from PySide6.QtCore import Qt
-import json
+                               QTableView, QPushButton, QStyledItemDelegate,
+                               QStyleOptionViewItem, QMessageBox, QTextEdit,
+                               QDialog, QFormLayout, QLineEdit, QCheckBox,
+                               QGroupBox)
+from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex
+from utils import json_compat
+
+
+# Custom role returning every role a cell paints with in one model call
+MultipleRolesRole = Qt.UserRole + 1
+
+
+class GeneTableModel(QAbstractTableModel):
+    """Read-only table model over the gene definitions"""
+    
+    HEADERS = ["Gene ID", "Display Name", "Alleles", "X-Linked"]
+    CELL_FLAGS = Qt.ItemIsEnabled | Qt.ItemIsSelectable
+    CELL_ALIGNMENT = Qt.AlignLeft | Qt.AlignVCenter
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._gene_ids = []
+        self._row_cache = []
+    
+    def set_genes(self, genes):
+        """Replace the model contents with a single reset"""
+        self.beginResetModel()
+        self._gene_ids = list(genes.keys())
+        self._row_cache = [
+            tuple((text, self.CELL_ALIGNMENT) for text in (
+                gene_id,
+                gene_data.get('name', ''),
+                ', '.join(gene_data.get('alleles', [])),
+                'Yes' if gene_data.get('x_linked') else 'No'
+            ))
+            for gene_id, gene_data in genes.items()
+        ]
+        self.endResetModel()
+    
+    def gene_id_at(self, row):
+        """Get the gene ID shown on a row"""
+        return self._gene_ids[row]
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._row_cache)
+    
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+    
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        
+        cell = self._row_cache[index.row()][index.column()]
+        if role == MultipleRolesRole:
+            return cell
+        if role == Qt.DisplayRole:
+            return cell[0]
+        if role == Qt.TextAlignmentRole:
+            return cell[1]
+        return None
+    
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+    
+    def flags(self, index):
+        # Every cell is read-only and selectable
+        return self.CELL_FLAGS
+
+
+class GeneTableDelegate(QStyledItemDelegate):
+    """Delegate that fetches all paint roles of a cell in one call"""
+    
+    def initStyleOption(self, option, index):
+        cell = index.data(MultipleRolesRole)
+        if cell is None:
+            super().initStyleOption(option, index)
+            return
+        
+        text, alignment = cell
+        option.index = index
+        option.displayAlignment = alignment
+        if text:
+            option.text = text
+            option.features |= QStyleOptionViewItem.HasDisplay
 
 
 class AdminTab(QWidget):
@@ -39,12 +121,13 @@ class AdminTab(QWidget):
         layout.addWidget(warning)
         
         # Gene table
-        self.table = QTableWidget()
-        self.table.setColumnCount(4)
-        self.table.setHorizontalHeaderLabels(["Gene ID", "Display Name", "Alleles", "X-Linked"])
-        self.table.setSelectionBehavior(QTableWidget.SelectRows)
-        self.table.setSelectionMode(QTableWidget.SingleSelection)
-        self.table.setEditTriggers(QTableWidget.NoEditTriggers)
+        self.gene_model = GeneTableModel(self)
+        self.table = QTableView()
+        self.table.setModel(self.gene_model)
+        self.table.setItemDelegate(GeneTableDelegate(self.table))
+        self.table.setSelectionBehavior(QTableView.SelectRows)
+        self.table.setSelectionMode(QTableView.SingleSelection)
+        self.table.setEditTriggers(QTableView.NoEditTriggers)
         
         self.table.setColumnWidth(0, 150)
         self.table.setColumnWidth(1, 200)
@@ -79,26 +162,15 @@ class AdminTab(QWidget):
     
     def refresh_gene_list(self):
         """Refresh the gene table"""
-        self.table.setRowCount(0)
-        
         genetics = self.main_window.genetics_engine
-        
-        for gene_id, gene_data in genetics.genes.items():
-            row = self.table.rowCount()
-            self.table.insertRow(row)
-            
-            self.table.setItem(row, 0, QTableWidgetItem(gene_id))
-            self.table.setItem(row, 1, QTableWidgetItem(gene_data.get('name', '')))
-            self.table.setItem(row, 2, QTableWidgetItem(', '.join(gene_data.get('alleles', []))))
-            self.table.setItem(row, 3, QTableWidgetItem('Yes' if gene_data.get('x_linked') else 'No'))
+        self.gene_model.set_genes(genetics.genes)
     
     def get_selected_gene_id(self):
         """Get the ID of the selected gene"""
-        selected = self.table.selectedItems()
+        selected = self.table.selectionModel().selectedRows()
         if not selected:
             return None
-        row = selected[0].row()
-        return self.table.item(row, 0).text()
+        return self.gene_model.gene_id_at(selected[0].row())
     
     def edit_gene(self):
         """Edit the selected gene"""
@@ -179,6 +251,10 @@ class GeneEditorDialog(QDialog):
         else:
             self.gene_data = gene_data.copy()
         
+        # Last successfully parsed JSON text and its result
+        self._parsed_text = None
+        self._parsed_data = None
+        
         self.setWindowTitle("Edit Gene" if gene_id else "Add Gene")
         self.setModal(True)
         self.resize(700, 600)
@@ -212,7 +288,7 @@ class GeneEditorDialog(QDialog):
         json_layout = QVBoxLayout()
         
         self.json_edit = QTextEdit()
-        self.json_edit.setPlainText(json.dumps(self.gene_data, indent=2))
+        self.json_edit.setPlainText(json_compat.dumps(self.gene_data, indent=True))
         json_layout.addWidget(self.json_edit)
         
         json_group.setLayout(json_layout)
@@ -235,8 +311,12 @@ class GeneEditorDialog(QDialog):
     def save(self):
         """Validate and save gene data"""
         try:
-            # Parse JSON
-            gene_data = json.loads(self.json_edit.toPlainText())
+            # Parse JSON (reuse the last parse if the text is unchanged)
+            text = self.json_edit.toPlainText()
+            if text != self._parsed_text:
+                self._parsed_data = json_compat.loads(text)
+                self._parsed_text = text
+            gene_data = dict(self._parsed_data)
             
             # Update basic fields
             gene_data['name'] = self.name_input.text()
@@ -251,7 +331,7 @@ class GeneEditorDialog(QDialog):
             self.gene_data = gene_data
             self.accept()
             
-        except json.JSONDecodeError as e:
+        except json_compat.JSONDecodeError as e:
             QMessageBox.critical(self, "JSON Error", f"Invalid JSON format:\n{str(e)}")
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Validation failed:\n{str(e)}")
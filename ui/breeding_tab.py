@@ -3,12 +3,96 @@ Breeding tab - interface for breeding cats and viewing litter results
 """
 
 from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel,
-                               QComboBox, QPushButton, QSpinBox, QTextEdit,
+                               QComboBox, QPushButton, QSpinBox, QPlainTextEdit,
                                QGroupBox, QMessageBox, QDoubleSpinBox)
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QTimer, QObject, QRunnable, QThreadPool, Signal
 from datetime import datetime
 
 
+def format_litter_preview(sire, dam, litter, phenotype_calc, genetics) -> str:
+    """Build the plain-text litter preview"""
+    gene_info_map = {
+        gene_name: (gene_info['name'], gene_info.get('dominance', {}))
+        for gene_name, gene_info in genetics.genes.items()
+    }
+    eye_colors = phenotype_calc.calculate_eye_colors(litter)
+    white_pcts = phenotype_calc.calculate_white_percentages(litter)
+    
+    parts = [
+        "LITTER PREVIEW\n",
+        f"{'=' * 80}\n\n",
+        f"Sire: #{sire.id} - {sire.name or 'Unnamed'}\n",
+        f"      {phenotype_calc.calculate_phenotype(sire)}\n\n",
+        f"Dam:  #{dam.id} - {dam.name or 'Unnamed'}\n",
+        f"      {phenotype_calc.calculate_phenotype(dam)}\n\n",
+        f"Litter Size: {len(litter)}\n",
+        f"{'=' * 80}\n\n",
+    ]
+    
+    for i, kitten in enumerate(litter):
+        parts.append(
+            f"KITTEN #{i + 1}\n"
+            f"{'-' * 40}\n"
+            f"Sex: {kitten.sex.capitalize()}\n"
+            f"Phenotype: {phenotype_calc.calculate_phenotype(kitten)}\n"
+            f"Eye Color: {eye_colors[i]}\n"
+            f"White: {white_pcts[i]}%\n"
+            f"Build: {kitten.get_build_phenotype()}\n"
+            f"Size: {kitten.get_size_phenotype()}\n"
+            f"\nGenotype:\n"
+        )
+        
+        for gene_name, alleles in sorted(kitten.genes.items()):
+            info = gene_info_map.get(gene_name)
+            if info:
+                display_name, dom = info
+                if len(alleles) == 1:
+                    parts.append(f"  {display_name}: {alleles[0]}\n")
+                else:
+                    # Dominant allele first
+                    if len(alleles) == 2:
+                        a0, a1 = alleles
+                        ordered = (a1, a0) if dom.get(a0, 0) < dom.get(a1, 0) else (a0, a1)
+                    else:
+                        ordered = sorted(alleles, key=lambda a: dom.get(a, 0), reverse=True)
+                    parts.append(f"  {display_name}: {'/'.join(ordered)}\n")
+        
+        parts.append("\n")
+    
+    return ''.join(parts)
+
+
+class BreedWorkerSignals(QObject):
+    """Signals emitted by BreedWorker"""
+    finished = Signal(list)
+    error = Signal(str)
+
+
+class BreedWorker(QRunnable):
+    """Generates a litter on a pool thread"""
+    
+    def __init__(self, breeding_engine, sire, dam, litter_size, rarity_boost=1.0, gene_table=None):
+        super().__init__()
+        self.breeding_engine = breeding_engine
+        self.gene_table = gene_table
+        self.sire = sire
+        self.dam = dam
+        self.litter_size = litter_size
+        self.rarity_boost = rarity_boost
+        self.signals = BreedWorkerSignals()
+    
+    def run(self):
+        """Breed the litter and hand it, or the error, back to the GUI thread"""
+        try:
+            litter = self.breeding_engine.breed_cats(
+                self.sire, self.dam, self.litter_size, self.rarity_boost, self.gene_table
+            )
+        except Exception as e:
+            self.signals.error.emit(str(e))
+            return
+        self.signals.finished.emit(litter)
+
+
 class BreedingTab(QWidget):
     """Breeding interface"""
     
@@ -16,6 +100,14 @@ class BreedingTab(QWidget):
         super().__init__()
         self.main_window = main_window
         self.pending_litter = []
+        
+        # Coalesce bursts of refresh requests into a single rebuild
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(50)
+        self._refresh_timer.timeout.connect(self._do_refresh_parents)
+        self._breed_worker = None
+        
         self.setup_ui()
     
     def setup_ui(self):
@@ -70,9 +162,9 @@ class BreedingTab(QWidget):
         # Action buttons
         button_layout = QHBoxLayout()
         
-        generate_btn = QPushButton("Generate Litter")
-        generate_btn.clicked.connect(self.generate_litter)
-        button_layout.addWidget(generate_btn)
+        self.generate_btn = QPushButton("Generate Litter")
+        self.generate_btn.clicked.connect(self.generate_litter)
+        button_layout.addWidget(self.generate_btn)
         
         self.save_btn = QPushButton("Save Litter to Registry")
         self.save_btn.setEnabled(False)
@@ -86,7 +178,7 @@ class BreedingTab(QWidget):
         preview_group = QGroupBox("Litter Preview")
         preview_layout = QVBoxLayout()
         
-        self.preview_text = QTextEdit()
+        self.preview_text = QPlainTextEdit()
         self.preview_text.setReadOnly(True)
         self.preview_text.setMinimumHeight(300)
         preview_layout.addWidget(self.preview_text)
@@ -95,27 +187,29 @@ class BreedingTab(QWidget):
         layout.addWidget(preview_group)
     
     def refresh_parent_lists(self):
+        """Schedule a refresh of the parent selection dropdowns"""
+        self._refresh_timer.start()
+    
+    def _do_refresh_parents(self):
         """Refresh the parent selection dropdowns"""
         registry = self.main_window.registry
         phenotype_calc = self.main_window.phenotype_calculator
         
-        # Clear existing items
-        self.sire_combo.clear()
-        self.dam_combo.clear()
-        
         # Get males and females
-        males = registry.get_males()
-        females = registry.get_females()
-        
-        # Populate sire combo
-        for cat in sorted(males, key=lambda c: c.id):
-            label = f"#{cat.id} - {cat.name if cat.name else 'Unnamed'} - {phenotype_calc.calculate_phenotype(cat)}"
-            self.sire_combo.addItem(label, cat.id)
-        
-        # Populate dam combo
-        for cat in sorted(females, key=lambda c: c.id):
-            label = f"#{cat.id} - {cat.name if cat.name else 'Unnamed'} - {phenotype_calc.calculate_phenotype(cat)}"
-            self.dam_combo.addItem(label, cat.id)
+        males = sorted(registry.get_males(), key=lambda c: c.id)
+        females = sorted(registry.get_females(), key=lambda c: c.id)
+        pheno = phenotype_calc.calculate_phenotypes(registry.cats.values())
+        
+        for combo, cats in ((self.sire_combo, males), (self.dam_combo, females)):
+            labels = [f"#{cat.id} - {cat.name or 'Unnamed'} - {pheno[cat.id]}" for cat in cats]
+            ids = [cat.id for cat in cats]
+            
+            combo.blockSignals(True)
+            combo.clear()
+            combo.addItems(labels)
+            for i, cat_id in enumerate(ids):
+                combo.setItemData(i, cat_id)
+            combo.blockSignals(False)
     
     def generate_litter(self):
         """Generate a litter from selected parents"""
@@ -142,7 +236,7 @@ class BreedingTab(QWidget):
         registry = self.main_window.registry
         breeding_engine = self.main_window.breeding_engine
         
-        if breeding_engine.check_relatedness(sire_id, dam_id, registry.cats):
+        if registry.check_relatedness(sire_id, dam_id):
             reply = QMessageBox.question(
                 self,
                 "Related Cats",
@@ -156,54 +250,49 @@ class BreedingTab(QWidget):
         sire = registry.get_cat(sire_id)
         dam = registry.get_cat(dam_id)
         
-        # Generate litter
-        # Generate litter
+        # Generate litter off the GUI thread
         litter_size = self.litter_size.value()
         
-        self.pending_litter = breeding_engine.breed_cats(
-            sire, dam, litter_size, 1.0  
-        )
+        self.generate_btn.setEnabled(False)
+        self.save_btn.setEnabled(False)
+        
+        # The worker reads a snapshot, so gene edits in the Admin tab cannot race it
+        gene_table = dict(self.main_window.genetics_engine.genes)
+        worker = BreedWorker(breeding_engine, sire, dam, litter_size, 1.0, gene_table)
+        worker.signals.finished.connect(self._on_litter_ready)
+        worker.signals.error.connect(self._on_litter_failed)
+        self._breed_worker = worker
+        QThreadPool.globalInstance().start(worker)
+    
+    def _on_litter_ready(self, litter):
+        """Show a litter generated by BreedWorker"""
+        sire, dam = self._breed_worker.sire, self._breed_worker.dam
+        self._breed_worker = None
+        self.pending_litter = litter
         
         # Display preview
         self.display_litter_preview(sire, dam)
+        self.generate_btn.setEnabled(True)
         self.save_btn.setEnabled(True)
     
+    def _on_litter_failed(self, message):
+        """Restore the controls after BreedWorker failed"""
+        self._breed_worker = None
+        self.generate_btn.setEnabled(True)
+        self.save_btn.setEnabled(bool(self.pending_litter))
+        QMessageBox.critical(self, "Breeding Failed", f"Failed to generate litter:\n{message}")
+    
     def display_litter_preview(self, sire, dam):
         """Display the generated litter in the preview area"""
-        phenotype_calc = self.main_window.phenotype_calculator
-        
-        text = f"LITTER PREVIEW\n"
-        text += f"{'=' * 80}\n\n"
-        text += f"Sire: #{sire.id} - {sire.name if sire.name else 'Unnamed'}\n"
-        text += f"      {phenotype_calc.calculate_phenotype(sire)}\n\n"
-        text += f"Dam:  #{dam.id} - {dam.name if dam.name else 'Unnamed'}\n"
-        text += f"      {phenotype_calc.calculate_phenotype(dam)}\n\n"
-        text += f"Litter Size: {len(self.pending_litter)}\n"
-        text += f"{'=' * 80}\n\n"
-        
-        for i, kitten in enumerate(self.pending_litter, 1):
-            text += f"KITTEN #{i}\n"
-            text += f"{'-' * 40}\n"
-            text += f"Sex: {kitten.sex.capitalize()}\n"
-            text += f"Phenotype: {phenotype_calc.calculate_phenotype(kitten)}\n"
-            text += f"Eye Color: {phenotype_calc.calculate_eye_color(kitten)}\n"
-            text += f"White: {phenotype_calc.get_white_percentage(kitten)}%\n"
-            text += f"Build: {kitten.get_build_phenotype()}\n"
-            text += f"Size: {kitten.get_size_phenotype()}\n"
-            text += f"\nGenotype:\n"
-            
-            for gene_name, alleles in sorted(kitten.genes.items()):
-                gene_info = self.main_window.genetics_engine.get_gene_info(gene_name)
-                if gene_info:
-                    display_name = gene_info['name']
-                    if len(alleles) == 1:
-                        text += f"  {display_name}: {alleles[0]}\n"
-                    else:
-                        text += f"  {display_name}: {alleles[0]}/{alleles[1]}\n"
-            
-            text += "\n"
+        text = format_litter_preview(
+            sire, dam, self.pending_litter,
+            self.main_window.phenotype_calculator,
+            self.main_window.genetics_engine
+        )
         
+        self.preview_text.setUpdatesEnabled(False)
         self.preview_text.setPlainText(text)
+        self.preview_text.setUpdatesEnabled(True)
     
     def save_litter(self):
         """Save the pending litter to the registry"""
@@ -212,21 +301,22 @@ class BreedingTab(QWidget):
         
         registry = self.main_window.registry
         
-        # Add each kitten to registry
+        # Add the whole litter to the registry at once
+        birth_date = datetime.now().strftime('%Y-%m-%d')
         for kitten in self.pending_litter:
-            kitten.birth_date = datetime.now().strftime('%Y-%m-%d')
-            registry.add_cat(kitten)
+            kitten.birth_date = birth_date
+        registry.add_cats(self.pending_litter)
         
         count = len(self.pending_litter)
         self.pending_litter = []
         
         # Update UI
         self.save_btn.setEnabled(False)
-        self.preview_text.append(f"\n{'=' * 80}\n")
-        self.preview_text.append(f"✓ Saved {count} kitten(s) to registry!\n")
+        self.preview_text.appendPlainText(f"\n{'=' * 80}\n")
+        self.preview_text.appendPlainText(f"✓ Saved {count} kitten(s) to registry!\n")
         
         # Refresh registry tab
-        self.main_window.registry_tab.refresh_table()
+        self.main_window.registry_tab.schedule_refresh()
         
         QMessageBox.information(
             self,
@@ -3,11 +3,213 @@ Stunning Cat Details Dialog - Premium professional design
 Replace: ui/dialogs/cat_details_dialog.py
 """
 
+from functools import lru_cache
 from PySide6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QTextEdit,
                                QPushButton, QLabel, QWidget, QTabWidget,
-                               QGridLayout, QGroupBox, QScrollArea, QFrame, QSplitter)
+                               QGridLayout, QGroupBox, QScrollArea, QFrame, QSplitter,
+                               QProgressBar)
 from PySide6.QtCore import Qt, QPropertyAnimation, QEasingCurve, QTimer
-from PySide6.QtGui import QFont, QColor
+from PySide6.QtGui import (QFont, QColor, QFontMetrics, QGuiApplication, QPainter,
+                           QPixmap)
+
+
+# Gene layout of the genetics tab
+GENE_CATEGORIES = (
+    ("🎨 Color Genetics", ("base_color", "dilution", "red", "inhibitor", "wide_band")),
+    ("🐆 Pattern Genetics", ("agouti", "tabby", "spotted", "ticked", "bengal")),
+    ("❄️ Color Restriction", ("color_restriction", "karpati")),
+    ("⚪ White Spotting", ("white",)),
+    ("✨ Coat Type", ("fur_length",)),
+    ("👁 Eye Pigmentation", ("eye_pigment_1", "eye_pigment_2", "eye_pigment_3", "lipochrome")),
+)
+
+# Allele badge color per category
+CATEGORY_COLORS = {
+    "🎨 Color Genetics": "#3742fa",
+    "🐆 Pattern Genetics": "#e74c3c",
+    "❄️ Color Restriction": "#3742fa",
+    "⚪ White Spotting": "#95a5a6",
+    "✨ Coat Type": "#f39c12",
+    "👁 Eye Pigmentation": "#1abc9c",
+}
+
+
+# Accent colors used by the dialog's cards, one stylesheet rule per color
+STAT_CARD_COLORS = ("#667eea", "#f5576c", "#a29bfe", "#fd79a8", "#74b9ff")
+GENE_COLORS = tuple(dict.fromkeys(CATEGORY_COLORS.values()))
+METER_COLORS = ("#9b59b6", "#3498db", "#95a5a6")
+FAMILY_COLORS = ("#3498db", "#e74c3c", "#27ae60", "#e67e22")
+
+DIALOG_BASE_QSS = """
+    QDialog {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+            stop:0 #f5f7fa, stop:1 #c3cfe2);
+    }
+    QFrame[role="hero"][sex="male"] {
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+            stop:0 #667eea, stop:0.5 #764ba2, stop:1 #f093fb);
+    }
+    QFrame[role="hero"][sex="female"] {
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+            stop:0 #f093fb, stop:0.5 #f5576c, stop:1 #ff6b6b);
+    }
+    QWidget[role="content"] {
+        background: transparent;
+    }
+    QFrame[role="sidebar"] {
+        background: white;
+        border-radius: 12px;
+        border: 1px solid #e1e8ed;
+    }
+    QWidget[role="tab-page"] {
+        background: white;
+    }
+    QScrollArea[role="gene-scroll"] {
+        border: none;
+    }
+    QFrame[role="stat-card"] {
+        border-radius: 10px;
+    }
+    QLabel[role="stat-title"] {
+        font-size: 8pt;
+        color: rgba(255,255,255,0.8);
+        text-transform: uppercase;
+        font-weight: 600;
+        letter-spacing: 1px;
+    }
+    QLabel[role="stat-value"] {
+        font-size: 14pt;
+        color: white;
+        font-weight: bold;
+    }
+    QLabel[role="category-header"] {
+        font-size: 12pt;
+        font-weight: 700;
+        color: #2c3e50;
+        padding: 10px 0 5px 0;
+    }
+    QFrame[role="gene-item"] {
+        background: white;
+        border: 1px solid #e1e8ed;
+        border-radius: 6px;
+        padding: 12px;
+    }
+    QFrame[role="gene-item"]:hover {
+        border: 1px solid #3742fa;
+        background: #f8f9ff;
+    }
+    QLabel[role="gene-name"] {
+        font-weight: 700;
+        font-size: 11pt;
+        color: #2c3e50;
+    }
+    QLabel[role="gene-alleles"] {
+        font-family: 'Courier New';
+        font-weight: bold;
+        font-size: 11pt;
+        padding: 4px 10px;
+        border-radius: 4px;
+    }
+    QLabel[role="gene-desc"] {
+        font-size: 9pt;
+        color: #7f8c8d;
+        padding-top: 2px;
+    }
+    QProgressBar[role="mini-meter"] {
+        background: #ecf0f1;
+        border: none;
+        border-radius: 3px;
+        color: #2c3e50;
+        font-weight: 600;
+        font-size: 9pt;
+        text-align: left;
+        padding-left: 6px;
+    }
+    QProgressBar[role="mini-meter"]::chunk {
+        border-radius: 3px;
+    }
+    QFrame[role="family-box"] {
+        background: #f8f9fa;
+        border-radius: 8px;
+        padding: 15px;
+    }
+    QLabel[role="family-title"] {
+        font-weight: 700;
+        font-size: 12pt;
+    }
+    QFrame[role="family-member"] {
+        background: white;
+        border: 1px solid #e1e8ed;
+        border-radius: 6px;
+        padding: 10px;
+    }
+    QFrame[role="family-member"]:hover {
+        background: #f8f9ff;
+    }
+    QLabel[role="member-icon"] {
+        font-size: 18pt;
+    }
+    QLabel[role="member-name"] {
+        font-weight: 600;
+        color: #2c3e50;
+        font-size: 10pt;
+    }
+    QLabel[role="member-role"] {
+        color: #95a5a6;
+        font-size: 8pt;
+    }
+"""
+
+
+@lru_cache(maxsize=64)
+def lighten_color(color):
+    """Lighten a color"""
+    return QColor(color).lighter(130).name()
+
+
+@lru_cache(maxsize=32)
+def emoji_pixmap(text, pt, color="white"):
+    """Render a large emoji or symbol once to a transparent pixmap"""
+    font = QFont()
+    font.setPointSize(pt)
+    size = QFontMetrics(font).size(0, text)
+    ratio = QGuiApplication.instance().devicePixelRatio()
+    
+    pixmap = QPixmap(size * ratio)
+    pixmap.setDevicePixelRatio(ratio)
+    pixmap.fill(Qt.transparent)
+    
+    painter = QPainter(pixmap)
+    painter.setFont(font)
+    painter.setPen(QColor(color))
+    painter.drawText(0, 0, size.width(), size.height(), Qt.AlignCenter, text)
+    painter.end()
+    return pixmap
+
+
+# Per-accent rule templates, filled once per palette color
+STAT_CARD_TMPL = (
+    'QFrame[role="stat-card"][accent="{color}"] {{ background: qlineargradient('
+    'x1:0, y1:0, x2:1, y2:1, stop:0 {color}, stop:1 {light}); }}'
+)
+GENE_ALLELES_TMPL = 'QLabel[role="gene-alleles"][accent="{color}"] {{ color: {color}; background: {color}15; }}'
+METER_TMPL = 'QProgressBar[role="mini-meter"][accent="{color}"]::chunk {{ background: {color}; }}'
+FAMILY_TMPL = (
+    'QFrame[role="family-box"][accent="{color}"] {{ border-left: 4px solid {color}; }}\n'
+    'QLabel[role="family-title"][accent="{color}"] {{ color: {color}; }}\n'
+    'QFrame[role="family-member"][accent="{color}"]:hover {{ border: 1px solid {color}; }}\n'
+    'QLabel[role="member-icon"][accent="{color}"] {{ color: {color}; }}'
+)
+
+
+def build_dialog_qss():
+    """Build the dialog stylesheet with per-accent-color rules"""
+    rules = [DIALOG_BASE_QSS]
+    rules.extend(STAT_CARD_TMPL.format(color=c, light=lighten_color(c)) for c in STAT_CARD_COLORS)
+    rules.extend(GENE_ALLELES_TMPL.format(color=c) for c in GENE_COLORS)
+    rules.extend(METER_TMPL.format(color=c) for c in METER_COLORS)
+    rules.extend(FAMILY_TMPL.format(color=c) for c in FAMILY_COLORS)
+    return "\n".join(rules)
 
 
 class StatCard(QFrame):
@@ -16,53 +218,44 @@ class StatCard(QFrame):
     def __init__(self, title, value, icon, color):
         super().__init__()
         self.setFixedSize(160, 90)
-        self.setStyleSheet(f"""
-            QFrame {{
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
-                    stop:0 {color}, stop:1 {self.lighten(color)});
-                border-radius: 10px;
-            }}
-        """)
+        self.setProperty("role", "stat-card")
+        self.setProperty("accent", color)
         
         layout = QVBoxLayout()
         layout.setContentsMargins(12, 10, 12, 10)
         self.setLayout(layout)
         
         # Icon
-        icon_label = QLabel(icon)
-        icon_label.setStyleSheet("font-size: 28pt; background: transparent;")
-        layout.addWidget(icon_label)
+        self._icon = icon
+        self.icon_label = QLabel()
+        self.icon_label.setPixmap(emoji_pixmap(icon, 28, "white"))
+        layout.addWidget(self.icon_label)
         
         # Title
         title_label = QLabel(title)
-        title_label.setStyleSheet("""
-            font-size: 8pt;
-            color: rgba(255,255,255,0.8);
-            background: transparent;
-            text-transform: uppercase;
-            font-weight: 600;
-            letter-spacing: 1px;
-        """)
+        title_label.setProperty("role", "stat-title")
         layout.addWidget(title_label)
         
         # Value
-        value_label = QLabel(value)
-        value_label.setStyleSheet("""
-            font-size: 14pt;
-            color: white;
-            background: transparent;
-            font-weight: bold;
-        """)
-        layout.addWidget(value_label)
+        self.value_label = QLabel(value)
+        self.value_label.setProperty("role", "stat-value")
+        layout.addWidget(self.value_label)
+        
+        for label in (self.icon_label, title_label, self.value_label):
+            label.setAttribute(Qt.WA_NoSystemBackground)
         
         layout.addStretch()
     
-    def lighten(self, color):
-        """Lighten a color"""
-        qcolor = QColor(color)
-        h, s, l, a = qcolor.getHsl()
-        qcolor.setHsl(h, max(0, s - 30), min(255, l + 30), a)
-        return qcolor.name()
+    def set_value(self, value, icon=None, color=None):
+        """Update the card's value, and optionally its icon and accent color"""
+        self.value_label.setText(value)
+        if icon is not None and icon != self._icon:
+            self._icon = icon
+            self.icon_label.setPixmap(emoji_pixmap(icon, 28, "white"))
+        if color is not None and self.property("accent") != color:
+            self.setProperty("accent", color)
+            self.style().unpolish(self)
+            self.style().polish(self)
 
 
 class GeneItem(QFrame):
@@ -70,18 +263,7 @@ class GeneItem(QFrame):
     
     def __init__(self, name, alleles, description, color="#3742fa"):
         super().__init__()
-        self.setStyleSheet("""
-            QFrame {
-                background: white;
-                border: 1px solid #e1e8ed;
-                border-radius: 6px;
-                padding: 12px;
-            }
-            QFrame:hover {
-                border: 1px solid #3742fa;
-                background: #f8f9ff;
-            }
-        """)
+        self.setProperty("role", "gene-item")
         
         layout = QVBoxLayout()
         layout.setSpacing(5)
@@ -92,25 +274,14 @@ class GeneItem(QFrame):
         header = QHBoxLayout()
         
         name_label = QLabel(name)
-        name_label.setStyleSheet(f"""
-            font-weight: 700;
-            font-size: 11pt;
-            color: #2c3e50;
-        """)
+        name_label.setProperty("role", "gene-name")
         header.addWidget(name_label)
         
         header.addStretch()
         
         allele_label = QLabel(alleles)
-        allele_label.setStyleSheet(f"""
-            font-family: 'Courier New';
-            font-weight: bold;
-            font-size: 11pt;
-            color: {color};
-            background: {color}15;
-            padding: 4px 10px;
-            border-radius: 4px;
-        """)
+        allele_label.setProperty("role", "gene-alleles")
+        allele_label.setProperty("accent", color)
         header.addWidget(allele_label)
         
         layout.addLayout(header)
@@ -118,11 +289,7 @@ class GeneItem(QFrame):
         # Description
         if description:
             desc_label = QLabel(description)
-            desc_label.setStyleSheet("""
-                font-size: 9pt;
-                color: #7f8c8d;
-                padding-top: 2px;
-            """)
+            desc_label.setProperty("role", "gene-desc")
             desc_label.setWordWrap(True)
             layout.addWidget(desc_label)
 
@@ -130,25 +297,34 @@ class GeneItem(QFrame):
 class CatDetailsDialog(QDialog):
     """Stunning cat profile with premium design"""
     
+    _DIALOG_QSS = build_dialog_qss()
+    
     def __init__(self, cat, main_window, parent=None):
         super().__init__(parent)
         self.cat = cat
         self.main_window = main_window
-        self.setWindowTitle(f"Cat Profile - {cat.name or f'#{cat.id}'}")
         self.setModal(True)
         self.resize(1100, 750)
         
-        self.setStyleSheet("""
-            QDialog {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #f5f7fa, stop:1 #c3cfe2);
-            }
-        """)
-        
+        self.load_cat_data()
         self.setup_ui()
     
+    def load_cat_data(self):
+        """Compute everything the dialog displays about the cat"""
+        cat = self.cat
+        self.setWindowTitle(f"Cat Profile - {cat.name or f'#{cat.id}'}")
+        self._pheno = self.main_window.phenotype_calculator.compute_all(cat)
+        
+        # Family lookups shared by the hero and family tab
+        registry = self.main_window.registry
+        self._sire = registry.get_cat(cat.sire_id) if cat.sire_id else None
+        self._dam = registry.get_cat(cat.dam_id) if cat.dam_id else None
+        self._offspring = registry.get_offspring(cat.id, limit=12)
+        self._offspring_count = registry.count_offspring(cat.id)
+    
     def setup_ui(self):
         """Create stunning interface"""
+        self.setStyleSheet(self._DIALOG_QSS)
         layout = QVBoxLayout()
         layout.setSpacing(0)
         layout.setContentsMargins(0, 0, 0, 0)
@@ -170,18 +346,8 @@ class CatDetailsDialog(QDialog):
         """Create hero section"""
         hero = QFrame()
         hero.setFixedHeight(200)
-        
-        # Dynamic gradient based on sex
-        if self.cat.sex == "male":
-            gradient = "stop:0 #667eea, stop:0.5 #764ba2, stop:1 #f093fb"
-        else:
-            gradient = "stop:0 #f093fb, stop:0.5 #f5576c, stop:1 #ff6b6b"
-        
-        hero.setStyleSheet(f"""
-            QFrame {{
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0, {gradient});
-            }}
-        """)
+        hero.setProperty("role", "hero")
+        self._hero = hero
         
         layout = QHBoxLayout()
         layout.setContentsMargins(40, 30, 40, 30)
@@ -192,27 +358,25 @@ class CatDetailsDialog(QDialog):
         info_layout.setSpacing(8)
         
         # Cat emoji/icon with animation feel
-        icon = QLabel("🐱")
-        icon.setStyleSheet("""
-            font-size: 52pt;
-            background: transparent;
-        """)
+        icon = QLabel()
+        icon.setPixmap(emoji_pixmap("🐱", 52))
+        icon.setAttribute(Qt.WA_NoSystemBackground)
         info_layout.addWidget(icon)
         
         # Name
-        name_text = self.cat.name or f"Cat #{self.cat.id}"
-        name_label = QLabel(name_text)
+        name_label = QLabel()
         name_label.setStyleSheet("""
             font-size: 28pt;
             font-weight: 800;
             color: white;
-            background: transparent;
             text-shadow: 2px 2px 4px rgba(0,0,0,0.2);
         """)
+        name_label.setAttribute(Qt.WA_NoSystemBackground)
         info_layout.addWidget(name_label)
+        self._name_label = name_label
         
         # ID badge
-        id_badge = QLabel(f"ID: #{self.cat.id}")
+        id_badge = QLabel()
         id_badge.setStyleSheet("""
             font-size: 10pt;
             color: white;
@@ -223,16 +387,18 @@ class CatDetailsDialog(QDialog):
         """)
         id_badge.setMaximumWidth(100)
         info_layout.addWidget(id_badge)
+        self._id_badge = id_badge
         
         # Birth & generation
-        meta = QLabel(f"📅 {self.cat.birth_date}  •  Gen {self.calculate_generation()}")
+        meta = QLabel()
         meta.setStyleSheet("""
             font-size: 10pt;
             color: rgba(255,255,255,0.9);
-            background: transparent;
             padding-top: 5px;
         """)
+        meta.setAttribute(Qt.WA_NoSystemBackground)
         info_layout.addWidget(meta)
+        self._meta_label = meta
         
         layout.addLayout(info_layout)
         layout.addStretch()
@@ -241,45 +407,50 @@ class CatDetailsDialog(QDialog):
         stats_layout = QHBoxLayout()
         stats_layout.setSpacing(15)
         
-        phenotype_calc = self.main_window.phenotype_calculator
-        white_pct = phenotype_calc.get_white_percentage(self.cat)
-        
-        stats_layout.addWidget(StatCard(
-            "Sex",
-            self.cat.sex.upper(),
-            "♂" if self.cat.sex == "male" else "♀",
-            "#667eea" if self.cat.sex == "male" else "#f5576c"
-        ))
-        
-        stats_layout.addWidget(StatCard(
-            "Build",
-            self.cat.get_build_phenotype(),
-            "🏋️",
-            "#a29bfe"
-        ))
-        
-        stats_layout.addWidget(StatCard(
-            "Size",
-            self.cat.get_size_phenotype(),
-            "📏",
-            "#fd79a8"
-        ))
-        
-        stats_layout.addWidget(StatCard(
-            "White",
-            f"{white_pct}%",
-            "⚪",
-            "#74b9ff"
-        ))
+        self._sex_card = StatCard("Sex", "", "♂", "#667eea")
+        stats_layout.addWidget(self._sex_card)
+        
+        self._build_card = StatCard("Build", "", "🏋️", "#a29bfe")
+        stats_layout.addWidget(self._build_card)
+        
+        self._size_card = StatCard("Size", "", "📏", "#fd79a8")
+        stats_layout.addWidget(self._size_card)
+        
+        self._white_card = StatCard("White", "", "⚪", "#74b9ff")
+        stats_layout.addWidget(self._white_card)
         
         layout.addLayout(stats_layout)
         
+        self.update_hero()
         return hero
     
+    def update_hero(self):
+        """Show the current cat's name, ID, birth date and quick stats in the hero"""
+        cat = self.cat
+        pheno = self._pheno
+        male = cat.sex == "male"
+        
+        # Dynamic gradient based on sex
+        sex = "male" if male else "female"
+        if self._hero.property("sex") != sex:
+            self._hero.setProperty("sex", sex)
+            self._hero.style().unpolish(self._hero)
+            self._hero.style().polish(self._hero)
+        
+        self._name_label.setText(cat.name or f"Cat #{cat.id}")
+        self._id_badge.setText(f"ID: #{cat.id}")
+        self._meta_label.setText(f"📅 {cat.birth_date}  •  Gen {self.calculate_generation()}")
+        
+        self._sex_card.set_value(cat.sex.upper(), "♂" if male else "♀",
+                                 "#667eea" if male else "#f5576c")
+        self._build_card.set_value(pheno.build_pheno)
+        self._size_card.set_value(pheno.size_pheno)
+        self._white_card.set_value(f"{pheno.white_pct}%")
+    
     def create_content(self):
         """Create main content area"""
         content = QWidget()
-        content.setStyleSheet("background: transparent;")
+        content.setProperty("role", "content")
         layout = QHBoxLayout()
         layout.setContentsMargins(20, 20, 20, 20)
         layout.setSpacing(20)
@@ -299,23 +470,13 @@ class CatDetailsDialog(QDialog):
         """Create sidebar with phenotype"""
         sidebar = QFrame()
         sidebar.setFixedWidth(320)
-        sidebar.setStyleSheet("""
-            QFrame {
-                background: white;
-                border-radius: 12px;
-                border: 1px solid #e1e8ed;
-            }
-        """)
+        sidebar.setProperty("role", "sidebar")
         
         layout = QVBoxLayout()
         layout.setContentsMargins(25, 25, 25, 25)
         layout.setSpacing(15)
         sidebar.setLayout(layout)
         
-        phenotype_calc = self.main_window.phenotype_calculator
-        phenotype = phenotype_calc.calculate_phenotype(self.cat)
-        eye_color = phenotype_calc.calculate_eye_color(self.cat)
-        
         # Section title
         title = QLabel("APPEARANCE")
         title.setStyleSheet("""
@@ -331,7 +492,7 @@ class CatDetailsDialog(QDialog):
         pheno_label.setStyleSheet("font-weight: 600; color: #2c3e50; font-size: 10pt;")
         layout.addWidget(pheno_label)
         
-        pheno_value = QLabel(phenotype)
+        pheno_value = QLabel()
         pheno_value.setStyleSheet("""
             font-size: 13pt;
             font-weight: 600;
@@ -343,13 +504,14 @@ class CatDetailsDialog(QDialog):
         """)
         pheno_value.setWordWrap(True)
         layout.addWidget(pheno_value)
+        self._pheno_value = pheno_value
         
         # Eye color
         eye_label = QLabel("Eye Color")
         eye_label.setStyleSheet("font-weight: 600; color: #2c3e50; font-size: 10pt; padding-top: 10px;")
         layout.addWidget(eye_label)
         
-        eye_value = QLabel(f"👁 {eye_color}")
+        eye_value = QLabel()
         eye_value.setStyleSheet("""
             font-size: 11pt;
             color: #2c3e50;
@@ -359,6 +521,7 @@ class CatDetailsDialog(QDialog):
         """)
         eye_value.setWordWrap(True)
         layout.addWidget(eye_value)
+        self._eye_value = eye_value
         
         # Physical traits
         traits_title = QLabel("PHYSICAL TRAITS")
@@ -372,50 +535,41 @@ class CatDetailsDialog(QDialog):
         layout.addWidget(traits_title)
         
         # Trait meters
-        layout.addWidget(self.create_mini_meter("Build", self.cat.build_value, "#9b59b6"))
-        layout.addWidget(self.create_mini_meter("Size", self.cat.size_value, "#3498db"))
+        self._build_meter = self.create_mini_meter("#9b59b6")
+        layout.addWidget(self._build_meter)
+        self._size_meter = self.create_mini_meter("#3498db")
+        layout.addWidget(self._size_meter)
         
-        white_pct = phenotype_calc.get_white_percentage(self.cat)
-        layout.addWidget(self.create_mini_meter("White", white_pct, "#95a5a6"))
+        self._white_meter = self.create_mini_meter("#95a5a6")
+        layout.addWidget(self._white_meter)
         
         layout.addStretch()
         
+        self.update_sidebar()
         return sidebar
     
-    def create_mini_meter(self, label, value, color):
+    def update_sidebar(self):
+        """Show the current cat's phenotype, eye color and trait meters in the sidebar"""
+        pheno = self._pheno
+        self._pheno_value.setText(pheno.phenotype)
+        self._eye_value.setText(f"👁 {pheno.eye_color}")
+        self.set_mini_meter(self._build_meter, "Build", self.cat.build_value)
+        self.set_mini_meter(self._size_meter, "Size", self.cat.size_value)
+        self.set_mini_meter(self._white_meter, "White", pheno.white_pct)
+    
+    def create_mini_meter(self, color):
         """Create compact progress meter"""
-        container = QWidget()
-        container.setStyleSheet("background: transparent;")
-        layout = QVBoxLayout()
-        layout.setSpacing(5)
-        layout.setContentsMargins(0, 0, 0, 0)
-        container.setLayout(layout)
-        
-        # Label and value
-        header = QHBoxLayout()
-        name_label = QLabel(label)
-        name_label.setStyleSheet("font-weight: 600; color: #2c3e50; font-size: 9pt;")
-        header.addWidget(name_label)
-        
-        value_label = QLabel(f"{value}")
-        value_label.setStyleSheet(f"font-weight: 700; color: {color}; font-size: 9pt;")
-        header.addWidget(value_label)
-        
-        layout.addLayout(header)
-        
-        # Progress bar
-        bar_bg = QFrame()
-        bar_bg.setFixedHeight(6)
-        bar_bg.setStyleSheet("background: #ecf0f1; border-radius: 3px;")
-        
-        bar_fill = QFrame(bar_bg)
-        bar_fill.setFixedHeight(6)
-        bar_fill.setFixedWidth(int((value / 100) * 270))
-        bar_fill.setStyleSheet(f"background: {color}; border-radius: 3px;")
-        
-        layout.addWidget(bar_bg)
-        
-        return container
+        meter = QProgressBar()
+        meter.setRange(0, 100)
+        meter.setFixedHeight(18)
+        meter.setProperty("role", "mini-meter")
+        meter.setProperty("accent", color)
+        return meter
+    
+    def set_mini_meter(self, meter, label, value):
+        """Show a labelled value on a mini meter"""
+        meter.setValue(value)
+        meter.setFormat(f"{label}   {value}")
     
     def create_tabs(self):
         """Create tabbed content"""
@@ -444,15 +598,44 @@ class CatDetailsDialog(QDialog):
             }
         """)
         
-        tabs.addTab(self.create_genetics_tab(), "🧬 Genetics")
-        tabs.addTab(self.create_family_tab(), "👨‍👩‍👧 Family Tree")
+        # Tab contents are built on first activation
+        tabs.addTab(QWidget(), "🧬 Genetics")
+        tabs.addTab(QWidget(), "👨‍👩‍👧 Family Tree")
+        self._tabs = tabs
+        self._tab_builders = {0: self.create_genetics_tab, 1: self.create_family_tab}
+        self._tab_built = {0: False, 1: False}
+        tabs.currentChanged.connect(self._ensure_tab_built)
+        
+        # Build the initially visible tab once the dialog is on screen
+        QTimer.singleShot(0, self._build_current_tab)
         
         return tabs
     
+    def _build_current_tab(self):
+        """Build the tab that is currently shown"""
+        self._ensure_tab_built(self._tabs.currentIndex())
+    
+    def _ensure_tab_built(self, idx):
+        """Build a tab's contents the first time it is shown"""
+        if idx < 0 or self._tab_built[idx]:
+            return
+        self._tab_built[idx] = True
+        
+        label = self._tabs.tabText(idx)
+        current = self._tabs.currentIndex()
+        
+        self._tabs.blockSignals(True)
+        placeholder = self._tabs.widget(idx)
+        self._tabs.removeTab(idx)
+        self._tabs.insertTab(idx, self._tab_builders[idx](), label)
+        self._tabs.setCurrentIndex(current)
+        self._tabs.blockSignals(False)
+        placeholder.deleteLater()
+    
     def create_genetics_tab(self):
         """Create genetics tab"""
         widget = QWidget()
-        widget.setStyleSheet("background: white;")
+        widget.setProperty("role", "tab-page")
         layout = QVBoxLayout()
         layout.setContentsMargins(25, 25, 25, 25)
         widget.setLayout(layout)
@@ -464,35 +647,28 @@ class CatDetailsDialog(QDialog):
         
         scroll = QScrollArea()
         scroll.setWidgetResizable(True)
-        scroll.setStyleSheet("border: none;")
+        scroll.setProperty("role", "gene-scroll")
         
         scroll_content = QWidget()
+        scroll_content.setProperty("role", "tab-page")
         scroll_layout = QVBoxLayout()
         scroll_layout.setSpacing(20)
         scroll_content.setLayout(scroll_layout)
         
         genetics = self.main_window.genetics_engine
         
-        categories = {
-            "🎨 Color Genetics": ["base_color", "dilution", "red", "inhibitor", "wide_band"],
-            "🐆 Pattern Genetics": ["agouti", "tabby", "spotted", "ticked", "bengal"],
-            "❄️ Color Restriction": ["color_restriction", "karpati"],
-            "⚪ White Spotting": ["white"],
-            "✨ Coat Type": ["fur_length"],
-            "👁 Eye Pigmentation": ["eye_pigment_1", "eye_pigment_2", "eye_pigment_3", "lipochrome"]
-        }
+        # Fill the grid without intermediate layout and paint passes
+        scroll_content.setUpdatesEnabled(False)
+        scroll_content.blockSignals(True)
         
-        for category, genes in categories.items():
+        for category, gene_ids in GENE_CATEGORIES:
             # Category header
             cat_header = QLabel(category)
-            cat_header.setStyleSheet("""
-                font-size: 12pt;
-                font-weight: 700;
-                color: #2c3e50;
-                padding: 10px 0 5px 0;
-            """)
+            cat_header.setProperty("role", "category-header")
             scroll_layout.addWidget(cat_header)
             
+            color = CATEGORY_COLORS[category]
+            
             # Gene grid
             gene_grid = QGridLayout()
             gene_grid.setSpacing(10)
@@ -500,44 +676,20 @@ class CatDetailsDialog(QDialog):
             col = 0
             row = 0
             
-            for gene_name in genes:
-                if gene_name in self.cat.genes:
-                    alleles = self.cat.genes[gene_name]
-                    gene_info = genetics.get_gene_info(gene_name)
-                    
-                    if gene_info:
-                        # Format data
-                        display_name = gene_info['name']
-                        
-                        if len(alleles) == 1:
-                            allele_text = alleles[0]
-                            desc = genetics.get_allele_description(gene_name, alleles[0])
-                        else:
-                            dom = gene_info.get('dominance', {})
-                            sorted_alleles = sorted(alleles, key=lambda a: dom.get(a, 0), reverse=True)
-                            allele_text = f"{sorted_alleles[0]}/{sorted_alleles[1]}"
-                            desc1 = genetics.get_allele_description(gene_name, sorted_alleles[0])
-                            desc2 = genetics.get_allele_description(gene_name, sorted_alleles[1])
-                            desc = f"{desc1}, {desc2}"
-                        
-                        # Get category color
-                        color = "#3742fa" if "Color" in category else \
-                                "#e74c3c" if "Pattern" in category else \
-                                "#9b59b6" if "Restriction" in category else \
-                                "#95a5a6" if "White" in category else \
-                                "#f39c12" if "Coat" in category else "#1abc9c"
-                        
-                        gene_item = GeneItem(display_name, allele_text, desc, color)
-                        gene_grid.addWidget(gene_item, row, col)
-                        
-                        col += 1
-                        if col >= 2:
-                            col = 0
-                            row += 1
+            for _, display_name, allele_text, desc in genetics.get_display_bundle(self.cat.genes, gene_ids):
+                gene_item = GeneItem(display_name, allele_text, desc, color)
+                gene_grid.addWidget(gene_item, row, col)
+                
+                col += 1
+                if col >= 2:
+                    col = 0
+                    row += 1
             
             scroll_layout.addLayout(gene_grid)
         
         scroll_layout.addStretch()
+        scroll_content.blockSignals(False)
+        scroll_content.setUpdatesEnabled(True)
         scroll.setWidget(scroll_content)
         layout.addWidget(scroll)
         
@@ -546,37 +698,33 @@ class CatDetailsDialog(QDialog):
     def create_family_tab(self):
         """Create family tab"""
         widget = QWidget()
-        widget.setStyleSheet("background: white;")
+        widget.setProperty("role", "tab-page")
         layout = QVBoxLayout()
         layout.setContentsMargins(25, 25, 25, 25)
         layout.setSpacing(20)
         widget.setLayout(layout)
         
-        registry = self.main_window.registry
-        
         # Parents
         parents_box = self.create_family_box("👨‍👩‍👧 Parents", "#27ae60")
         parents_layout = parents_box.layout()
         
-        if self.cat.sire_id:
-            sire = registry.get_cat(self.cat.sire_id)
-            if sire:
-                parents_layout.addWidget(self.create_family_member(
-                    f"#{sire.id}" + (f" - {sire.name}" if sire.name else ""),
-                    "Sire",
-                    "♂",
-                    "#3498db"
-                ))
-        
-        if self.cat.dam_id:
-            dam = registry.get_cat(self.cat.dam_id)
-            if dam:
-                parents_layout.addWidget(self.create_family_member(
-                    f"#{dam.id}" + (f" - {dam.name}" if dam.name else ""),
-                    "Dam",
-                    "♀",
-                    "#e74c3c"
-                ))
+        sire = self._sire
+        if sire:
+            parents_layout.addWidget(self.create_family_member(
+                f"#{sire.id} - {sire.name}" if sire.name else f"#{sire.id}",
+                "Sire",
+                "♂",
+                "#3498db"
+            ))
+        
+        dam = self._dam
+        if dam:
+            parents_layout.addWidget(self.create_family_member(
+                f"#{dam.id} - {dam.name}" if dam.name else f"#{dam.id}",
+                "Dam",
+                "♀",
+                "#e74c3c"
+            ))
         
         if not self.cat.sire_id and not self.cat.dam_id:
             no_parents = QLabel("🌟 Founder cat - No parents recorded")
@@ -586,23 +734,24 @@ class CatDetailsDialog(QDialog):
         layout.addWidget(parents_box)
         
         # Offspring
-        offspring = registry.get_offspring(self.cat.id)
-        offspring_box = self.create_family_box(f"👶 Offspring ({len(offspring)})", "#e67e22")
+        offspring = self._offspring
+        total = self._offspring_count
+        offspring_box = self.create_family_box(f"👶 Offspring ({total})", "#e67e22")
         offspring_layout = offspring_box.layout()
         
         if offspring:
-            for child in offspring[:12]:
+            for child in offspring:
                 sex_icon = "♂" if child.sex == "male" else "♀"
                 sex_color = "#3498db" if child.sex == "male" else "#e74c3c"
                 offspring_layout.addWidget(self.create_family_member(
-                    f"#{child.id}" + (f" - {child.name}" if child.name else ""),
+                    f"#{child.id} - {child.name}" if child.name else f"#{child.id}",
                     child.sex.capitalize(),
                     sex_icon,
                     sex_color
                 ))
             
-            if len(offspring) > 12:
-                more = QLabel(f"... and {len(offspring) - 12} more offspring")
+            if total > len(offspring):
+                more = QLabel(f"... and {total - len(offspring)} more offspring")
                 more.setStyleSheet("color: #95a5a6; font-style: italic; padding: 10px;")
                 offspring_layout.addWidget(more)
         else:
@@ -640,25 +789,16 @@ class CatDetailsDialog(QDialog):
     def create_family_box(self, title, color):
         """Create family section box"""
         box = QFrame()
-        box.setStyleSheet(f"""
-            QFrame {{
-                background: #f8f9fa;
-                border-left: 4px solid {color};
-                border-radius: 8px;
-                padding: 15px;
-            }}
-        """)
+        box.setProperty("role", "family-box")
+        box.setProperty("accent", color)
         
         layout = QVBoxLayout()
         layout.setSpacing(8)
         box.setLayout(layout)
         
         title_label = QLabel(title)
-        title_label.setStyleSheet(f"""
-            font-weight: 700;
-            font-size: 12pt;
-            color: {color};
-        """)
+        title_label.setProperty("role", "family-title")
+        title_label.setProperty("accent", color)
         layout.addWidget(title_label)
         
         return box
@@ -666,18 +806,8 @@ class CatDetailsDialog(QDialog):
     def create_family_member(self, name, role, icon, color):
         """Create family member item"""
         widget = QFrame()
-        widget.setStyleSheet(f"""
-            QFrame {{
-                background: white;
-                border: 1px solid #e1e8ed;
-                border-radius: 6px;
-                padding: 10px;
-            }}
-            QFrame:hover {{
-                border: 1px solid {color};
-                background: #f8f9ff;
-            }}
-        """)
+        widget.setProperty("role", "family-member")
+        widget.setProperty("accent", color)
         
         layout = QHBoxLayout()
         layout.setContentsMargins(0, 0, 0, 0)
@@ -685,7 +815,8 @@ class CatDetailsDialog(QDialog):
         
         # Icon
         icon_label = QLabel(icon)
-        icon_label.setStyleSheet(f"font-size: 18pt; color: {color}; background: transparent;")
+        icon_label.setProperty("role", "member-icon")
+        icon_label.setProperty("accent", color)
         layout.addWidget(icon_label)
         
         # Info
@@ -693,11 +824,11 @@ class CatDetailsDialog(QDialog):
         info_layout.setSpacing(2)
         
         name_label = QLabel(name)
-        name_label.setStyleSheet("font-weight: 600; color: #2c3e50; font-size: 10pt;")
+        name_label.setProperty("role", "member-name")
         info_layout.addWidget(name_label)
         
         role_label = QLabel(role)
-        role_label.setStyleSheet("color: #95a5a6; font-size: 8pt;")
+        role_label.setProperty("role", "member-role")
         info_layout.addWidget(role_label)
         
         layout.addLayout(info_layout)
@@ -761,16 +892,7 @@ class CatDetailsDialog(QDialog):
     
     def calculate_generation(self):
         """Calculate generation"""
-        def get_gen(cat_id, depth=0):
-            if depth > 50:
-                return 0
-            cat = self.main_window.registry.get_cat(cat_id)
-            if not cat or (not cat.sire_id and not cat.dam_id):
-                return 0
-            sire_gen = get_gen(cat.sire_id, depth + 1) if cat.sire_id else 0
-            dam_gen = get_gen(cat.dam_id, depth + 1) if cat.dam_id else 0
-            return max(sire_gen, dam_gen) + 1
-        return get_gen(self.cat.id)
+        return self.main_window.registry.get_generation(self.cat.id)
     
     def show_pedigree(self):
         """Show pedigree"""
@@ -781,8 +903,23 @@ class CatDetailsDialog(QDialog):
     def edit_cat(self):
         """Edit cat"""
         from ui.dialogs.cat_editor_dialog import CatEditorDialog
-        dialog = CatEditorDialog(self.cat, self.main_window, self)
-        if dialog.exec():
-            self.accept()
-            new_dialog = CatDetailsDialog(self.cat, self.main_window, self.parent())
-            new_dialog.exec()
\ No newline at end of file
+        dialog = CatEditorDialog.get_or_create(self.main_window)
+        if dialog.open_for(self.cat):
+            self.refresh()
+            self.main_window.registry_tab.schedule_refresh()
+    
+    def bind(self, cat):
+        """Show a different cat in this dialog"""
+        self.cat = cat
+        self.refresh()
+    
+    def refresh(self):
+        """Reload the cat into the existing widgets"""
+        self.load_cat_data()
+        self.update_hero()
+        self.update_sidebar()
+        
+        # Rebuild the visible tab now and the others when they are next shown
+        for idx in self._tab_built:
+            self._tab_built[idx] = False
+        self._build_current_tab()
\ No newline at end of file
@@ -2,13 +2,29 @@
 Dialog for adding or editing cats
 """
 
+import re
 from PySide6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QFormLayout,
-                               QPushButton, QLabel, QLineEdit, QComboBox,
+                               QPushButton, QLabel, QLineEdit, QComboBox, QDateEdit,
                                QScrollArea, QWidget, QGroupBox, QRadioButton,
-                               QButtonGroup, QMessageBox)
-from PySide6.QtCore import Qt
+                               QMessageBox)
+from PySide6.QtCore import Qt, QDate, QPoint, QTimer
+from PySide6.QtGui import QStandardItem, QStandardItemModel
 from core.cat import Cat
-from datetime import datetime
+
+
+# Rows within this many pixels of the viewport are built ahead of scrolling
+GENE_PREFETCH_MARGIN = 200
+
+ID_PATTERN = re.compile(r'-?\d+')
+
+
+def parse_id(text):
+    """Parse a stripped optional ID field, returning (valid, id or None)"""
+    if not text:
+        return True, None
+    if ID_PATTERN.fullmatch(text):
+        return True, int(text)
+    return False, None
 
 
 class CatEditorDialog(QDialog):
@@ -20,24 +36,72 @@ class CatEditorDialog(QDialog):
         self.main_window = main_window
         self.is_edit = cat is not None
         
-        title = f"Edit Cat #{cat.id}" if self.is_edit else "Add New Cat"
-        self.setWindowTitle(title)
+        self.setWindowTitle(self.title_text())
         self.setModal(True)
         self.resize(900, 750)
         
-        self.gene_selectors = {}
-        self.setup_ui()
+        # Built gene rows as parallel lists; gene_rows maps gene name -> row
+        self.gene_rows = {}
+        self._gene_names = []
+        self._combo1s = []
+        self._combo2s = []
+        self._is_x_linked = []
+        self._gene_alleles = []
+        self._pending_genes = []
+        self._allele_model_cache = {}
+        self._populated = False
+        self._form_built = False
+        self._genes_version = main_window.genetics_engine.version
+        
+        # Lightweight skeleton; the form is built once the window is showing
+        layout = QVBoxLayout()
+        self.setLayout(layout)
+        self.loading_label = QLabel("Loading…")
+        self.loading_label.setAlignment(Qt.AlignCenter)
+        layout.addWidget(self.loading_label)
+    
+    @classmethod
+    def get_or_create(cls, main_window):
+        """Get the shared editor dialog, rebuilding it if the gene set has changed"""
+        dialog = main_window._cat_editor_dialog
+        if dialog is not None and dialog._genes_version != main_window.genetics_engine.version:
+            dialog.deleteLater()
+            dialog = None
+        if dialog is None:
+            dialog = cls(None, main_window, main_window)
+            main_window._cat_editor_dialog = dialog
+        return dialog
+    
+    def open_for(self, cat):
+        """Rebind the dialog to a cat (None to add a new one) and run it"""
+        self.cat = cat
+        self.is_edit = cat is not None
+        self.setWindowTitle(self.title_text())
+        if self._form_built:
+            self.reset_fields()
+        return self.exec()
+    
+    def title_text(self):
+        """Get the heading for the current cat"""
+        return f"Edit Cat #{self.cat.id}" if self.is_edit else "Add New Cat"
+    
+    def showEvent(self, event):
+        """Build the form after the first show so the window appears immediately"""
+        super().showEvent(event)
+        if not self._populated:
+            self._populated = True
+            QTimer.singleShot(0, self.setup_ui)
     
     def setup_ui(self):
         """Create the dialog interface"""
-        layout = QVBoxLayout()
-        self.setLayout(layout)
+        layout = self.layout()
+        layout.removeWidget(self.loading_label)
+        self.loading_label.deleteLater()
         
         # Title
-        title_text = f"Edit Cat #{self.cat.id}" if self.is_edit else "Add New Cat"
-        title = QLabel(title_text)
-        title.setStyleSheet("font-size: 14pt; font-weight: bold;")
-        layout.addWidget(title)
+        self.title_label = QLabel(self.title_text())
+        self.title_label.setStyleSheet("font-size: 14pt; font-weight: bold;")
+        layout.addWidget(self.title_label)
         
         # Scrollable area for form
         scroll = QScrollArea()
@@ -52,21 +116,16 @@ class CatEditorDialog(QDialog):
         basic_group = QGroupBox("Basic Information")
         basic_layout = QFormLayout()
         
-        self.name_input = QLineEdit()
-        if self.cat:
-            self.name_input.setText(self.cat.name)
+        # Fields are constructed with their initial text
+        cat = self.cat
+        self.name_input = QLineEdit(cat.name if cat else "")
         basic_layout.addRow("Name:", self.name_input)
         
-        # Sex selection
-        sex_widget = QWidget()
+        # Sex selection; sibling radios are auto-exclusive
         sex_layout = QHBoxLayout()
-        sex_layout.setContentsMargins(0, 0, 0, 0)
-        self.sex_group = QButtonGroup()
         
         self.male_radio = QRadioButton("Male")
         self.female_radio = QRadioButton("Female")
-        self.sex_group.addButton(self.male_radio, 0)
-        self.sex_group.addButton(self.female_radio, 1)
         
         if self.cat and self.cat.sex == 'male':
             self.male_radio.setChecked(True)
@@ -76,40 +135,58 @@ class CatEditorDialog(QDialog):
         sex_layout.addWidget(self.male_radio)
         sex_layout.addWidget(self.female_radio)
         sex_layout.addStretch()
-        sex_widget.setLayout(sex_layout)
-        basic_layout.addRow("Sex:", sex_widget)
+        basic_layout.addRow("Sex:", sex_layout)
         
-        self.date_input = QLineEdit()
-        if self.cat:
-            self.date_input.setText(self.cat.birth_date)
-        else:
-            self.date_input.setText(datetime.now().strftime('%Y-%m-%d'))
+        self.date_input = QDateEdit()
+        self.date_input.setDisplayFormat("yyyy-MM-dd")
+        self.date_input.setCalendarPopup(False)
+        self.load_birth_date()
         basic_layout.addRow("Birth Date:", self.date_input)
         
-        self.sire_input = QLineEdit()
-        if self.cat and self.cat.sire_id:
-            self.sire_input.setText(str(self.cat.sire_id))
+        self.sire_input = QLineEdit(str(cat.sire_id) if cat and cat.sire_id else "")
         basic_layout.addRow("Sire ID:", self.sire_input)
         
-        self.dam_input = QLineEdit()
-        if self.cat and self.cat.dam_id:
-            self.dam_input.setText(str(self.cat.dam_id))
+        self.dam_input = QLineEdit(str(cat.dam_id) if cat and cat.dam_id else "")
         basic_layout.addRow("Dam ID:", self.dam_input)
         
         basic_group.setLayout(basic_layout)
         scroll_layout.addWidget(basic_group)
         
-        # Genetics group
+        # Genetics group; no painting anywhere in the dialog until it is complete
+        self.setUpdatesEnabled(False)
         genes_group = QGroupBox("Genetics")
+        genes_group.setStyleSheet("QLabel#geneLabel { min-width: 200px; }")
         genes_layout = QVBoxLayout()
         
+        # Gene rows start as fixed-height stubs and are built as they scroll into view
+        scroll_widget.setUpdatesEnabled(False)
+        genes_group.setUpdatesEnabled(False)
         genetics = self.main_window.genetics_engine
+        self._genes_version = genetics.version
+        self.x_linked_genes = genetics.get_x_linked_genes()
+        row_height = None
         for gene_name, gene_data in genetics.genes.items():
-            gene_widget = self.create_gene_selector(gene_name, gene_data)
-            genes_layout.addWidget(gene_widget)
+            if row_height is None:
+                gene_widget = self.create_gene_selector(gene_name, gene_data)
+                genes_layout.addWidget(gene_widget)
+                row_height = gene_widget.sizeHint().height()
+                continue
+            stub = QWidget()
+            stub.setFixedHeight(row_height)
+            genes_layout.addWidget(stub)
+            self._pending_genes.append((gene_name, gene_data, stub))
         
         genes_group.setLayout(genes_layout)
         scroll_layout.addWidget(genes_group)
+        genes_group.setUpdatesEnabled(True)
+        scroll_widget.setUpdatesEnabled(True)
+        genes_layout.activate()
+        self.setUpdatesEnabled(True)
+        
+        self.scroll = scroll
+        self.genes_layout = genes_layout
+        scroll.verticalScrollBar().valueChanged.connect(self._materialize_visible)
+        QTimer.singleShot(0, self._materialize_visible)
         
         # Buttons
         button_layout = QHBoxLayout()
@@ -124,99 +201,198 @@ class CatEditorDialog(QDialog):
         
         button_layout.addStretch()
         layout.addLayout(button_layout)
+        self._form_built = True
+    
+    def load_birth_date(self):
+        """Show the current cat's birth date, defaulting to today"""
+        cat = self.cat
+        birth = QDate.fromString(cat.birth_date, Qt.ISODate) if cat and cat.birth_date else QDate()
+        self.date_input.setDate(birth if birth.isValid() else QDate.currentDate())
+        # Stored dates that don't parse are kept unless the user picks a new one
+        self._initial_birth_date = self.date_input.date()
+        self._unparsed_birth_date = cat.birth_date if cat and cat.birth_date and not birth.isValid() else None
+    
+    def reset_fields(self):
+        """Load the current cat into the already built form"""
+        cat = self.cat
+        self.title_label.setText(self.title_text())
+        self.name_input.setText(cat.name if cat else "")
+        if cat and cat.sex == 'male':
+            self.male_radio.setChecked(True)
+        else:
+            self.female_radio.setChecked(True)
+        self.load_birth_date()
+        self.sire_input.setText(str(cat.sire_id) if cat and cat.sire_id else "")
+        self.dam_input.setText(str(cat.dam_id) if cat and cat.dam_id else "")
+        
+        # Rows still pending pick up the new cat when they are built
+        self.setUpdatesEnabled(False)
+        for row in range(len(self._gene_names)):
+            self.bind_gene_row(row)
+        self.setUpdatesEnabled(True)
+        self.scroll.verticalScrollBar().setValue(0)
     
     def create_gene_selector(self, gene_name, gene_data):
         """Create selector widget for a gene"""
         widget = QWidget()
         layout = QHBoxLayout()
-        layout.setContentsMargins(0, 5, 0, 5)
         widget.setLayout(layout)
         
         # Label
         label = QLabel(f"{gene_data['name']}:")
-        label.setMinimumWidth(200)
+        label.setObjectName("geneLabel")
         layout.addWidget(label)
         
-        # Allele selectors
-        alleles = gene_data['alleles']
-        
+        # Allele selectors share one model per allele list
         combo1 = QComboBox()
-        combo1.addItems(alleles)
+        combo1.setModel(self.get_allele_model(gene_data['alleles'])[0])
         layout.addWidget(combo1)
         
-        combo2 = QComboBox()
-        combo2.addItems(alleles)
-        layout.addWidget(combo2)
-        
-        # Set current values if editing
-        if self.cat and gene_name in self.cat.genes:
-            cat_alleles = self.cat.genes[gene_name]
-            if len(cat_alleles) >= 1:
-                combo1.setCurrentText(cat_alleles[0])
-            if len(cat_alleles) >= 2:
-                combo2.setCurrentText(cat_alleles[1])
-            
-            # Hide second combo for X-linked males
-            if gene_data.get('x_linked') and self.cat.sex == 'male':
+        row = len(self._gene_names)
+        self.gene_rows[gene_name] = row
+        self._gene_names.append(gene_name)
+        self._combo1s.append(combo1)
+        self._combo2s.append(None)
+        self._is_x_linked.append(gene_name in self.x_linked_genes)
+        self._gene_alleles.append(gene_data['alleles'])
+        self.bind_gene_row(row)
+        
+        return widget
+    
+    def bind_gene_row(self, row):
+        """Set a gene row's combos from the current cat"""
+        gene_name = self._gene_names[row]
+        combo1 = self._combo1s[row]
+        combo2 = self._combo2s[row]
+        model, allele_index = self.get_allele_model(self._gene_alleles[row])
+        
+        # X-linked males carry one allele; the second combo is only built when needed
+        cat = self.cat
+        hemizygous = cat is not None and cat.sex == 'male' and self._is_x_linked[row]
+        if hemizygous:
+            if combo2 is not None:
                 combo2.setVisible(False)
+        else:
+            if combo2 is None:
+                combo2 = QComboBox()
+                combo2.setModel(model)
+                combo1.parentWidget().layout().insertWidget(2, combo2)
+                self._combo2s[row] = combo2
+            combo2.setVisible(True)
         
-        self.gene_selectors[gene_name] = (combo1, combo2)
-        layout.addStretch()
+        cat_alleles = cat.genes.get(gene_name, ()) if cat else ()
+        combo1.setCurrentIndex(allele_index.get(cat_alleles[0], 0) if len(cat_alleles) >= 1 else 0)
+        if combo2 is not None:
+            combo2.setCurrentIndex(allele_index.get(cat_alleles[1], 0) if len(cat_alleles) >= 2 else 0)
+    
+    def get_allele_model(self, alleles):
+        """Get the shared combo model and allele -> row map for an allele list"""
+        key = tuple(alleles)
+        cached = self._allele_model_cache.get(key)
+        if cached is None:
+            model = QStandardItemModel(self)
+            for allele in key:
+                model.appendRow(QStandardItem(allele))
+            cached = (model, {allele: row for row, allele in enumerate(key)})
+            self._allele_model_cache[key] = cached
+        return cached
+    
+    def _materialize_visible(self):
+        """Build the gene rows whose stubs are in or near the viewport"""
+        if not self._pending_genes:
+            return
+        content = self.scroll.widget()
+        top = self.scroll.verticalScrollBar().value() - GENE_PREFETCH_MARGIN
+        bottom = top + self.scroll.viewport().height() + 2 * GENE_PREFETCH_MARGIN
         
-        return widget
+        pending = []
+        content.setUpdatesEnabled(False)
+        for gene_name, gene_data, stub in self._pending_genes:
+            y = stub.mapTo(content, QPoint(0, 0)).y()
+            if y + stub.height() >= top and y <= bottom:
+                self._replace_stub(gene_name, gene_data, stub)
+            else:
+                pending.append((gene_name, gene_data, stub))
+        content.setUpdatesEnabled(True)
+        self._pending_genes = pending
+    
+    def _materialize_all(self):
+        """Build every gene row that is still a stub"""
+        for gene_name, gene_data, stub in self._pending_genes:
+            self._replace_stub(gene_name, gene_data, stub)
+        self._pending_genes = []
+    
+    def _replace_stub(self, gene_name, gene_data, stub):
+        """Swap a placeholder stub for its gene selector row"""
+        gene_widget = self.create_gene_selector(gene_name, gene_data)
+        self.genes_layout.replaceWidget(stub, gene_widget)
+        stub.deleteLater()
     
     def save_cat(self):
         """Save the cat"""
+        self._materialize_all()
         try:
+            # Read each text field once
+            sire_text = self.sire_input.text().strip()
+            dam_text = self.dam_input.text().strip()
+            
             # Get sex
             sex = 'male' if self.male_radio.isChecked() else 'female'
             
             # Collect genes
             genes = {}
-            genetics = self.main_window.genetics_engine
-            
-            for gene_name, (combo1, combo2) in self.gene_selectors.items():
-                gene_data = genetics.get_gene_info(gene_name)
-                
-                if gene_data.get('x_linked') and sex == 'male':
+            is_male = sex == 'male'
+            for gene_name, combo1, combo2, x_linked, alleles in zip(
+                    self._gene_names, self._combo1s, self._combo2s,
+                    self._is_x_linked, self._gene_alleles):
+                if is_male and x_linked:
                     genes[gene_name] = [combo1.currentText()]
+                elif combo2 is None:
+                    # Male X-linked row saved as female: second allele defaults to the first choice
+                    genes[gene_name] = [combo1.currentText(), alleles[0]]
                 else:
                     genes[gene_name] = [combo1.currentText(), combo2.currentText()]
             
             # Get parent IDs
-            sire_id = None
-            dam_id = None
+            valid, sire_id = parse_id(sire_text)
+            if not valid:
+                QMessageBox.warning(self, "Invalid Input", "Sire ID must be a number")
+                return
             
-            if self.sire_input.text():
-                try:
-                    sire_id = int(self.sire_input.text())
-                except ValueError:
-                    QMessageBox.warning(self, "Invalid Input", "Sire ID must be a number")
-                    return
+            valid, dam_id = parse_id(dam_text)
+            if not valid:
+                QMessageBox.warning(self, "Invalid Input", "Dam ID must be a number")
+                return
             
-            if self.dam_input.text():
-                try:
-                    dam_id = int(self.dam_input.text())
-                except ValueError:
-                    QMessageBox.warning(self, "Invalid Input", "Dam ID must be a number")
-                    return
+            birth_date = self.date_input.date().toString(Qt.ISODate)
+            if (self._unparsed_birth_date is not None
+                    and self.date_input.date() == self._initial_birth_date):
+                birth_date = self._unparsed_birth_date
             
             if self.is_edit:
-                # Update existing cat
+                # Update existing cat, dropping caches only for fields they depend on
+                phenotype_changed = self.cat.genes != genes or self.cat.sex != sex
+                parents_changed = (self.cat.sire_id, self.cat.dam_id) != (sire_id, dam_id)
+                
                 self.cat.name = self.name_input.text()
                 self.cat.sex = sex
-                self.cat.birth_date = self.date_input.text()
+                self.cat.birth_date = birth_date
                 self.cat.sire_id = sire_id
                 self.cat.dam_id = dam_id
                 self.cat.genes = genes
-                self.cat.invalidate_cache()
+                if phenotype_changed:
+                    self.cat.invalidate_cache()
+                if parents_changed:
+                    self.main_window.registry.invalidate_ancestors()
+                else:
+                    self.main_window.registry.mark_modified()
             else:
                 # Create new cat
                 cat = Cat(
                     name=self.name_input.text(),
                     sex=sex,
                     genes=genes,
-                    birth_date=self.date_input.text(),
+                    birth_date=birth_date,
                     sire_id=sire_id,
                     dam_id=dam_id
                 )
@@ -3,11 +3,283 @@ Modern Cat Details Dialog - Beautiful redesigned cat profile viewer
 Replace: ui/dialogs/cat_details_dialog.py
 """
 
-from PySide6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QTextEdit,
+from functools import lru_cache
+from html import escape
+from PySide6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout,
                                QPushButton, QLabel, QWidget, QTabWidget,
-                               QGridLayout, QGroupBox, QScrollArea, QFrame)
-from PySide6.QtCore import Qt
-from PySide6.QtGui import QFont, QPixmap, QPalette, QColor
+                               QFrame, QTextBrowser, QProgressBar)
+from PySide6.QtCore import Qt, QTimer
+from ui.dialogs.cat_details_dialog import emoji_pixmap
+
+
+# Offspring listed before the "Show more" link
+OFFSPRING_PREVIEW = 8
+
+# Inline styles for the rich text family sections
+FAMILY_TITLE_STYLE = "font-size: 14pt; font-weight: bold;"
+FAMILY_EMPTY_STYLE = "color: #7f8c8d; font-style: italic;"
+TIP_QSS = "color: #7f8c8d; font-style: italic; padding: 10px;"
+
+# Accent palettes used by cards and meters
+INFO_CARD_COLORS = ("#3498db", "#e91e63", "#9b59b6", "#f39c12", "#95a5a6")
+TRAIT_METER_COLORS = ("#9b59b6", "#f39c12", "#95a5a6")
+
+# Static rules; widgets opt in with the "role" and "accent" properties
+DIALOG_BASE_QSS = """
+    QDialog {
+        background-color: #ecf0f1;
+    }
+    QWidget[role="tab-page"] {
+        background-color: white;
+    }
+    QFrame[role="info-card"] {
+        background-color: white;
+        border-radius: 12px;
+        padding: 15px;
+    }
+    QLabel[role="info-title"] {
+        font-size: 10pt;
+        color: #666;
+        font-weight: normal;
+    }
+    QLabel[role="info-value"] {
+        font-size: 14pt;
+        font-weight: bold;
+    }
+    QFrame[role="trait-meter"] {
+        background-color: #f8f9fa;
+        border-radius: 12px;
+        padding: 15px;
+        margin-bottom: 15px;
+    }
+    QLabel[role="meter-title"] {
+        font-size: 12pt;
+        font-weight: bold;
+    }
+    QProgressBar[role="trait-bar"] {
+        background-color: #ecf0f1;
+        border: none;
+        border-radius: 15px;
+    }
+    QLabel[role="meter-value"] {
+        font-size: 11pt;
+        font-weight: bold;
+        color: #2c3e50;
+    }
+    QLabel[role="meter-desc"] {
+        font-size: 11pt;
+        color: #7f8c8d;
+    }
+"""
+
+# Per-accent rule templates, filled once per palette color
+INFO_CARD_TMPL = (
+    'QFrame[role="info-card"][accent="{color}"] {{ border: 2px solid {color}; }}\n'
+    'QLabel[role="info-value"][accent="{color}"] {{ color: {color}; }}'
+)
+TRAIT_METER_TMPL = (
+    'QFrame[role="trait-meter"][accent="{color}"] {{ border-left: 5px solid {color}; }}\n'
+    'QLabel[role="meter-title"][accent="{color}"] {{ color: {color}; }}\n'
+    'QProgressBar[role="trait-bar"][accent="{color}"]::chunk {{ background: qlineargradient('
+    'x1:0, y1:0, x2:1, y2:0, stop:0 {color}, stop:1 {light}); border-radius: 15px; }}'
+)
+
+
+# Fixed stylesheets shared by every dialog instance
+HEADER_TMPL = """
+    QFrame {{
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+            {gradient_colors});
+        border-radius: 0px;
+    }}
+"""
+HEADER_QSS = {
+    "male": HEADER_TMPL.format(gradient_colors="stop:0 #667eea, stop:1 #764ba2"),
+    "female": HEADER_TMPL.format(gradient_colors="stop:0 #f093fb, stop:1 #f5576c"),
+}
+PHENOTYPE_CARD_QSS = """
+    QFrame {
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+            stop:0 #667eea, stop:1 #764ba2);
+        border-radius: 12px;
+        padding: 20px;
+        margin-top: 15px;
+    }
+"""
+TABS_QSS = """
+    QTabWidget::pane {
+        border: none;
+        background-color: white;
+        border-radius: 8px;
+    }
+    QTabBar::tab {
+        background-color: #bdc3c7;
+        color: #2c3e50;
+        padding: 10px 20px;
+        margin-right: 2px;
+        border-top-left-radius: 8px;
+        border-top-right-radius: 8px;
+        font-weight: bold;
+    }
+    QTabBar::tab:selected {
+        background-color: white;
+        color: #3498db;
+    }
+    QTabBar::tab:hover:!selected {
+        background-color: #95a5a6;
+    }
+"""
+PARENTS_FRAME_QSS = """
+    QFrame {
+        background-color: #e8f5e9;
+        border-radius: 12px;
+        padding: 15px;
+    }
+"""
+OFFSPRING_FRAME_QSS = """
+    QFrame {
+        background-color: #fff3e0;
+        border-radius: 12px;
+        padding: 15px;
+        margin-top: 15px;
+    }
+"""
+PEDIGREE_BUTTON_QSS = """
+    QPushButton {
+        background-color: #4CAF50;
+        color: white;
+        font-size: 12pt;
+        font-weight: bold;
+        border-radius: 8px;
+        margin-top: 15px;
+    }
+    QPushButton:hover {
+        background-color: #45a049;
+    }
+"""
+FOOTER_QSS = """
+    QFrame {
+        background-color: white;
+        border-top: 1px solid #bdc3c7;
+        padding: 15px;
+    }
+"""
+EDIT_BUTTON_QSS = """
+    QPushButton {
+        background-color: #3498db;
+        color: white;
+        font-weight: bold;
+        border-radius: 6px;
+        padding: 0px 20px;
+    }
+    QPushButton:hover {
+        background-color: #2980b9;
+    }
+"""
+CLOSE_BUTTON_QSS = """
+    QPushButton {
+        background-color: #95a5a6;
+        color: white;
+        font-weight: bold;
+        border-radius: 6px;
+    }
+    QPushButton:hover {
+        background-color: #7f8c8d;
+    }
+"""
+
+
+def lighten_color(hex_color):
+    """Lighten a hex color"""
+    # Simple lightening by mixing with white
+    return hex_color + "80"  # Add alpha for lighter appearance
+
+
+def build_dialog_qss():
+    """Build the dialog stylesheet with per-accent-color rules"""
+    rules = [DIALOG_BASE_QSS]
+    rules.extend(INFO_CARD_TMPL.format(color=c) for c in INFO_CARD_COLORS)
+    rules.extend(TRAIT_METER_TMPL.format(color=c, light=lighten_color(c)) for c in TRAIT_METER_COLORS)
+    return "\n".join(rules)
+
+
+# Gene categories shown on the Genetics tab, in display order
+GENE_CATEGORIES = {
+    "🎨 Color Genes": ("base_color", "dilution", "red", "inhibitor", "wide_band"),
+    "🐆 Pattern Genes": ("agouti", "tabby", "spotted", "ticked", "bengal"),
+    "❄️ Pointing & Restriction": ("color_restriction", "karpati"),
+    "⚪ White Genes": ("white",),
+    "✨ Physical Traits": ("fur_length",),
+    "👁 Eye Color Genes": ("eye_pigment_1", "eye_pigment_2", "eye_pigment_3", "lipochrome"),
+}
+
+# Category header markup, rendered once
+CATEGORY_HEADER_STYLE = "font-size: 13pt; font-weight: bold; color: #2c3e50; margin-top: 10px;"
+CATEGORY_HEADERS = {name: f'<p style="{CATEGORY_HEADER_STYLE}">{escape(name)}</p>'
+                    for name in GENE_CATEGORIES}
+
+
+def decorative_frame():
+    """Create a frame painted only by the stylesheet, skipping the system background erase"""
+    frame = QFrame()
+    frame.setAttribute(Qt.WA_NoSystemBackground)
+    return frame
+
+
+def cat_label(cat):
+    """Return "#id - name", or just "#id" for unnamed cats"""
+    return f"#{cat.id} - {cat.name}" if cat.name else f"#{cat.id}"
+
+
+@lru_cache(maxsize=256)
+def genotype_html(genetics, version, genotype):
+    """Render a genotype for the Genetics tab; version keys the cache to the gene data"""
+    cat_genes = dict(genotype)
+    get_gene_info = genetics.get_gene_info
+    describe_alleles = genetics.describe_alleles
+    
+    parts = []
+    for category_name, gene_list in GENE_CATEGORIES.items():
+        parts.append(CATEGORY_HEADERS[category_name])
+        parts.append('<table width="100%" cellspacing="4" cellpadding="10">')
+        
+        # Genes in category
+        for gene_name in gene_list:
+            alleles = cat_genes.get(gene_name)
+            if alleles:
+                gene_info = get_gene_info(gene_name)
+                
+                if gene_info:
+                    display_name = gene_info['name']
+                    
+                    # Format alleles
+                    if len(alleles) == 1:
+                        allele_text = f"{alleles[0]}"
+                        desc_text = describe_alleles(gene_name, (alleles[0],))
+                    else:
+                        # Dominant allele first
+                        dom = gene_info.get('dominance', {})
+                        if len(alleles) == 2:
+                            a0, a1 = alleles
+                            ordered = (a1, a0) if dom.get(a0, 0) < dom.get(a1, 0) else (a0, a1)
+                        else:
+                            ordered = tuple(sorted(alleles, key=lambda a: dom.get(a, 0), reverse=True))
+                        allele_text = "/".join(ordered)
+                        desc_text = describe_alleles(gene_name, ordered, " / ")
+                    
+                    # Gene row
+                    row = (f'<tr><td style="background-color: #f8f9fa;">'
+                           f'<b style="font-size: 11pt; color: #2c3e50;">{escape(display_name)}</b><br>'
+                           f'<span style="font-size: 10pt; color: #34495e; font-family: \'Courier New\';">'
+                           f'{escape(allele_text)}</span>')
+                    if desc_text:
+                        row += (f'<br><i style="font-size: 9pt; color: #7f8c8d;">'
+                                f'{escape(desc_text)}</i>')
+                    parts.append(row + '</td></tr>')
+        
+        parts.append('</table>')
+    
+    return '\n'.join(parts)
 
 
 class InfoCard(QFrame):
@@ -16,81 +288,55 @@ class InfoCard(QFrame):
     def __init__(self, title, value, icon="", color="#4CAF50"):
         super().__init__()
         self.setFrameShape(QFrame.StyledPanel)
-        self.setStyleSheet(f"""
-            QFrame {{
-                background-color: white;
-                border-radius: 12px;
-                border: 2px solid {color};
-                padding: 15px;
-            }}
-        """)
+        self.setAttribute(Qt.WA_NoSystemBackground)
+        self.setProperty("role", "info-card")
+        self.setProperty("accent", color)
         
         layout = QVBoxLayout()
         self.setLayout(layout)
         
         # Icon and title
         header_layout = QHBoxLayout()
+        self.icon_label = None
+        self._icon = icon
         if icon:
-            icon_label = QLabel(icon)
-            icon_label.setStyleSheet(f"font-size: 24pt; color: {color};")
-            header_layout.addWidget(icon_label)
+            self.icon_label = QLabel()
+            self.icon_label.setPixmap(emoji_pixmap(icon, 24, color))
+            header_layout.addWidget(self.icon_label)
         
         title_label = QLabel(title)
-        title_label.setStyleSheet(f"font-size: 10pt; color: #666; font-weight: normal;")
+        title_label.setProperty("role", "info-title")
         header_layout.addWidget(title_label)
         header_layout.addStretch()
         layout.addLayout(header_layout)
         
         # Value
-        value_label = QLabel(value)
-        value_label.setStyleSheet(f"font-size: 14pt; font-weight: bold; color: {color};")
-        value_label.setWordWrap(True)
-        layout.addWidget(value_label)
-
-
-class GeneCard(QFrame):
-    """Card for displaying a single gene"""
+        self.value_label = QLabel(value)
+        self.value_label.setProperty("role", "info-value")
+        self.value_label.setProperty("accent", color)
+        self.value_label.setWordWrap(True)
+        layout.addWidget(self.value_label)
     
-    def __init__(self, gene_name, alleles, description):
-        super().__init__()
-        self.setFrameShape(QFrame.StyledPanel)
-        self.setStyleSheet("""
-            QFrame {
-                background-color: #f8f9fa;
-                border-radius: 8px;
-                border-left: 4px solid #4CAF50;
-                padding: 10px;
-                margin: 2px;
-            }
-            QFrame:hover {
-                background-color: #e8f5e9;
-            }
-        """)
-        
-        layout = QVBoxLayout()
-        self.setLayout(layout)
-        
-        # Gene name
-        name_label = QLabel(gene_name)
-        name_label.setStyleSheet("font-weight: bold; font-size: 11pt; color: #2c3e50;")
-        layout.addWidget(name_label)
-        
-        # Alleles
-        allele_label = QLabel(alleles)
-        allele_label.setStyleSheet("font-size: 10pt; color: #34495e; font-family: 'Courier New';")
-        layout.addWidget(allele_label)
-        
-        # Description
-        if description:
-            desc_label = QLabel(description)
-            desc_label.setStyleSheet("font-size: 9pt; color: #7f8c8d; font-style: italic;")
-            desc_label.setWordWrap(True)
-            layout.addWidget(desc_label)
+    def set_value(self, value, icon=None, color=None):
+        """Update the card's value, and optionally its icon and accent color"""
+        self.value_label.setText(value)
+        accent = color if color is not None else self.property("accent")
+        if self.icon_label is not None and (icon is not None or color is not None):
+            self._icon = icon or self._icon
+            self.icon_label.setPixmap(emoji_pixmap(self._icon, 24, accent))
+        if color is not None:
+            for widget in (self, self.value_label):
+                if widget.property("accent") != color:
+                    widget.setProperty("accent", color)
+                    widget.style().unpolish(widget)
+                    widget.style().polish(widget)
 
 
 class ModernCatDetailsDialog(QDialog):
     """Beautiful modern cat profile viewer"""
     
+    _DIALOG_QSS = build_dialog_qss()
+    
     def __init__(self, cat, main_window, parent=None):
         super().__init__(parent)
         self.cat = cat
@@ -99,12 +345,8 @@ class ModernCatDetailsDialog(QDialog):
         self.setModal(True)
         self.resize(1000, 750)
         
-        # Set background
-        self.setStyleSheet("""
-            QDialog {
-                background-color: #ecf0f1;
-            }
-        """)
+        # One stylesheet for the dialog background, cards and meters
+        self.setStyleSheet(self._DIALOG_QSS)
         
         self.setup_ui()
     
@@ -129,32 +371,25 @@ class ModernCatDetailsDialog(QDialog):
         stats_layout = QHBoxLayout()
         stats_layout.setSpacing(15)
         
-        phenotype_calc = self.main_window.phenotype_calculator
-        phenotype = phenotype_calc.calculate_phenotype(self.cat)
-        eye_color = phenotype_calc.calculate_eye_color(self.cat)
-        white_pct = phenotype_calc.get_white_percentage(self.cat)
+        # Phenotype values are computed once and shared by the cards and tabs
+        self._pheno = self.main_window.phenotype_calculator.compute_all(self.cat)
+        pheno = self._pheno
         
         # Create stat cards
-        stats_layout.addWidget(InfoCard("Sex", self.cat.sex.capitalize(), 
-                                        "♂" if self.cat.sex == "male" else "♀", 
-                                        "#3498db" if self.cat.sex == "male" else "#e91e63"))
-        stats_layout.addWidget(InfoCard("Build", self.cat.get_build_phenotype(), "🏋️", "#9b59b6"))
-        stats_layout.addWidget(InfoCard("Size", self.cat.get_size_phenotype(), "📏", "#f39c12"))
-        stats_layout.addWidget(InfoCard("White", f"{white_pct}%", "⚪", "#95a5a6"))
+        self._sex_card = InfoCard("Sex", self.cat.sex.capitalize(), 
+                                  "♂" if self.cat.sex == "male" else "♀", 
+                                  "#3498db" if self.cat.sex == "male" else "#e91e63")
+        self._build_card = InfoCard("Build", pheno.build_pheno, "🏋️", "#9b59b6")
+        self._size_card = InfoCard("Size", pheno.size_pheno, "📏", "#f39c12")
+        self._white_card = InfoCard("White", f"{pheno.white_pct}%", "⚪", "#95a5a6")
+        for card in (self._sex_card, self._build_card, self._size_card, self._white_card):
+            stats_layout.addWidget(card)
         
         content_layout.addLayout(stats_layout)
         
         # Phenotype showcase
-        pheno_card = QFrame()
-        pheno_card.setStyleSheet("""
-            QFrame {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                    stop:0 #667eea, stop:1 #764ba2);
-                border-radius: 12px;
-                padding: 20px;
-                margin-top: 15px;
-            }
-        """)
+        pheno_card = decorative_frame()
+        pheno_card.setStyleSheet(PHENOTYPE_CARD_QSS)
         pheno_layout = QVBoxLayout()
         pheno_card.setLayout(pheno_layout)
         
@@ -162,54 +397,36 @@ class ModernCatDetailsDialog(QDialog):
         pheno_title.setStyleSheet("color: white; font-size: 12pt; font-weight: bold;")
         pheno_layout.addWidget(pheno_title)
         
-        pheno_text = QLabel(phenotype)
-        pheno_text.setStyleSheet("color: white; font-size: 16pt; font-weight: 600;")
-        pheno_text.setWordWrap(True)
-        pheno_layout.addWidget(pheno_text)
+        self._phenotype_label = QLabel(pheno.phenotype)
+        self._phenotype_label.setStyleSheet("color: white; font-size: 16pt; font-weight: 600;")
+        self._phenotype_label.setWordWrap(True)
+        pheno_layout.addWidget(self._phenotype_label)
         
-        eye_label = QLabel(f"👁 Eyes: {eye_color}")
-        eye_label.setStyleSheet("color: #f8f9fa; font-size: 11pt;")
-        pheno_layout.addWidget(eye_label)
+        self._eye_label = QLabel(f"👁 Eyes: {pheno.eye_color}")
+        self._eye_label.setStyleSheet("color: #f8f9fa; font-size: 11pt;")
+        pheno_layout.addWidget(self._eye_label)
         
         content_layout.addWidget(pheno_card)
         
         # Tabbed content
         tabs = QTabWidget()
-        tabs.setStyleSheet("""
-            QTabWidget::pane {
-                border: none;
-                background-color: white;
-                border-radius: 8px;
-            }
-            QTabBar::tab {
-                background-color: #bdc3c7;
-                color: #2c3e50;
-                padding: 10px 20px;
-                margin-right: 2px;
-                border-top-left-radius: 8px;
-                border-top-right-radius: 8px;
-                font-weight: bold;
-            }
-            QTabBar::tab:selected {
-                background-color: white;
-                color: #3498db;
-            }
-            QTabBar::tab:hover:!selected {
-                background-color: #95a5a6;
-            }
-        """)
-        
-        # Genotype tab
-        genotype_tab = self.create_genotype_tab()
-        tabs.addTab(genotype_tab, "🧬 Genetics")
-        
-        # Pedigree tab
-        pedigree_tab = self.create_pedigree_tab()
-        tabs.addTab(pedigree_tab, "👨‍👩‍👧‍👦 Family")
+        tabs.setStyleSheet(TABS_QSS)
+        
+        # Tabs start as placeholders and are built when first shown
+        tabs.addTab(QWidget(), "🧬 Genetics")
+        tabs.addTab(QWidget(), "👨‍👩‍👧‍👦 Family")
+        tabs.addTab(QWidget(), "📊 Physical Traits")
+        self._tabs = tabs
+        self._tab_builders = {
+            0: self.create_genotype_tab,
+            1: self.create_pedigree_tab,
+            2: self.create_physical_tab,
+        }
+        self._tab_built = {0: False, 1: False, 2: False}
+        tabs.currentChanged.connect(self._ensure_tab_built)
         
-        # Physical traits tab
-        physical_tab = self.create_physical_tab()
-        tabs.addTab(physical_tab, "📊 Physical Traits")
+        # Build the initially visible tab once the dialog is on screen
+        QTimer.singleShot(0, self._build_current_tab)
         
         content_layout.addWidget(tabs)
         layout.addWidget(content)
@@ -218,42 +435,48 @@ class ModernCatDetailsDialog(QDialog):
         footer = self.create_footer()
         layout.addWidget(footer)
     
+    def _build_current_tab(self):
+        """Build the tab that is currently shown"""
+        self._ensure_tab_built(self._tabs.currentIndex())
+    
+    def _ensure_tab_built(self, idx):
+        """Build a tab's contents the first time it is shown"""
+        if idx < 0 or self._tab_built[idx]:
+            return
+        self._tab_built[idx] = True
+        
+        label = self._tabs.tabText(idx)
+        current = self._tabs.currentIndex()
+        
+        # Swap the page in with one repaint instead of one per tab change
+        self._tabs.setUpdatesEnabled(False)
+        self._tabs.blockSignals(True)
+        placeholder = self._tabs.widget(idx)
+        self._tabs.removeTab(idx)
+        self._tabs.insertTab(idx, self._tab_builders[idx](), label)
+        self._tabs.setCurrentIndex(current)
+        self._tabs.blockSignals(False)
+        self._tabs.setUpdatesEnabled(True)
+        placeholder.deleteLater()
+    
     def create_header(self):
         """Create beautiful header section"""
-        header = QFrame()
+        header = self._header = decorative_frame()
         header.setMinimumHeight(120)
         
-        # Gradient background based on sex
-        if self.cat.sex == "male":
-            gradient_colors = "stop:0 #667eea, stop:1 #764ba2"
-        else:
-            gradient_colors = "stop:0 #f093fb, stop:1 #f5576c"
-        
-        header.setStyleSheet(f"""
-            QFrame {{
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                    {gradient_colors});
-                border-radius: 0px;
-            }}
-        """)
-        
         layout = QHBoxLayout()
         header.setLayout(layout)
         
         # Cat icon/placeholder
-        icon_label = QLabel("🐱")
-        icon_label.setStyleSheet("font-size: 48pt;")
+        icon_label = QLabel()
+        icon_label.setPixmap(emoji_pixmap("🐱", 48))
         layout.addWidget(icon_label)
         
         # Cat info
         info_layout = QVBoxLayout()
         
         # Cat ID and name
-        id_name = f"Cat #{self.cat.id}"
-        if self.cat.name:
-            id_name += f" • {self.cat.name}"
-        
-        name_label = QLabel(id_name)
+        self._name_label = name_label = QLabel()
         name_label.setStyleSheet("""
             font-size: 24pt;
             font-weight: bold;
@@ -263,212 +486,105 @@ class ModernCatDetailsDialog(QDialog):
         info_layout.addWidget(name_label)
         
         # Birth date
-        if self.cat.birth_date:
-            date_label = QLabel(f"📅 Born: {self.cat.birth_date}")
-            date_label.setStyleSheet("font-size: 11pt; color: rgba(255,255,255,0.9); background: transparent;")
-            info_layout.addWidget(date_label)
+        self._date_label = QLabel()
+        self._date_label.setStyleSheet("font-size: 11pt; color: rgba(255,255,255,0.9); background: transparent;")
+        info_layout.addWidget(self._date_label)
         
         # Generation info
-        generation = self.calculate_generation()
-        gen_label = QLabel(f"Generation {generation}")
-        gen_label.setStyleSheet("font-size: 10pt; color: rgba(255,255,255,0.8); background: transparent;")
-        info_layout.addWidget(gen_label)
+        self._gen_label = QLabel()
+        self._gen_label.setStyleSheet("font-size: 10pt; color: rgba(255,255,255,0.8); background: transparent;")
+        info_layout.addWidget(self._gen_label)
         
         layout.addLayout(info_layout)
         layout.addStretch()
         
+        self.update_header()
         return header
     
+    def update_header(self):
+        """Show the current cat's sex, name, birth date and generation in the header"""
+        cat = self.cat
+        
+        # Gradient background based on sex
+        self._header.setStyleSheet(HEADER_QSS["male" if cat.sex == "male" else "female"])
+        self._name_label.setText(f"Cat #{cat.id} • {cat.name}" if cat.name else f"Cat #{cat.id}")
+        self._date_label.setText(f"📅 Born: {cat.birth_date}")
+        self._date_label.setVisible(bool(cat.birth_date))
+        self._gen_label.setText(f"Generation {self.calculate_generation()}")
+    
+    def refresh(self):
+        """Reload the cat into the existing widgets after an edit"""
+        cat = self.cat
+        self.setWindowTitle(f"Cat Profile - #{cat.id}")
+        self._pheno = pheno = self.main_window.phenotype_calculator.compute_all(cat)
+        self.update_header()
+        
+        male = cat.sex == "male"
+        self._sex_card.set_value(cat.sex.capitalize(), "♂" if male else "♀",
+                                 "#3498db" if male else "#e91e63")
+        self._build_card.set_value(pheno.build_pheno)
+        self._size_card.set_value(pheno.size_pheno)
+        self._white_card.set_value(f"{pheno.white_pct}%")
+        self._phenotype_label.setText(pheno.phenotype)
+        self._eye_label.setText(f"👁 Eyes: {pheno.eye_color}")
+        
+        # Rebuild the visible tab now and the others when they are next shown
+        for idx in self._tab_built:
+            self._tab_built[idx] = False
+        self._build_current_tab()
+    
     def create_genotype_tab(self):
         """Create beautiful genotype display"""
         widget = QWidget()
-        widget.setStyleSheet("background-color: white;")
+        widget.setProperty("role", "tab-page")
         layout = QVBoxLayout()
         widget.setLayout(layout)
         
         # Search/filter bar
-        search_label = QLabel("💡 Tip: Hover over gene cards to highlight")
-        search_label.setStyleSheet("color: #7f8c8d; font-style: italic; padding: 10px;")
+        search_label = QLabel("💡 All genes organized by category")
+        search_label.setStyleSheet(TIP_QSS)
         layout.addWidget(search_label)
         
-        # Scrollable gene list
-        scroll = QScrollArea()
-        scroll.setWidgetResizable(True)
-        scroll.setStyleSheet("border: none; background-color: white;")
-        
-        scroll_content = QWidget()
-        scroll_layout = QVBoxLayout()
-        scroll_content.setLayout(scroll_layout)
+        # Gene list rendered as a single rich text document
+        browser = QTextBrowser()
+        browser.setOpenLinks(False)
+        browser.setStyleSheet("border: none; background-color: white;")
         
+        # Identical genotypes share one cached rendering until the gene data changes
         genetics = self.main_window.genetics_engine
-        
-        # Organize genes by category
-        categories = {
-            "🎨 Color Genes": ["base_color", "dilution", "red", "inhibitor", "wide_band"],
-            "🐆 Pattern Genes": ["agouti", "tabby", "spotted", "ticked", "bengal"],
-            "❄️ Pointing & Restriction": ["color_restriction", "karpati"],
-            "⚪ White Genes": ["white"],
-            "✨ Physical Traits": ["fur_length"],
-            "👁 Eye Color Genes": ["eye_pigment_1", "eye_pigment_2", "eye_pigment_3", "lipochrome"]
-        }
-        
-        for category_name, gene_list in categories.items():
-            # Category header
-            cat_header = QLabel(category_name)
-            cat_header.setStyleSheet("""
-                font-size: 13pt;
-                font-weight: bold;
-                color: #2c3e50;
-                padding: 10px 0px 5px 0px;
-                margin-top: 10px;
-            """)
-            scroll_layout.addWidget(cat_header)
-            
-            # Genes in category
-            for gene_name in gene_list:
-                if gene_name in self.cat.genes:
-                    alleles = self.cat.genes[gene_name]
-                    gene_info = genetics.get_gene_info(gene_name)
-                    
-                    if gene_info:
-                        display_name = gene_info['name']
-                        
-                        # Format alleles
-                        if len(alleles) == 1:
-                            desc = genetics.get_allele_description(gene_name, alleles[0])
-                            allele_text = f"{alleles[0]}"
-                            desc_text = desc
-                        else:
-                            dom = gene_info.get('dominance', {})
-                            sorted_alleles = sorted(alleles, 
-                                                  key=lambda a: dom.get(a, 0), 
-                                                  reverse=True)
-                            desc1 = genetics.get_allele_description(gene_name, sorted_alleles[0])
-                            desc2 = genetics.get_allele_description(gene_name, sorted_alleles[1])
-                            allele_text = f"{sorted_alleles[0]}/{sorted_alleles[1]}"
-                            desc_text = f"{desc1} / {desc2}"
-                        
-                        # Create gene card
-                        gene_card = GeneCard(display_name, allele_text, desc_text)
-                        scroll_layout.addWidget(gene_card)
-        
-        scroll_layout.addStretch()
-        scroll.setWidget(scroll_content)
-        layout.addWidget(scroll)
+        genotype = tuple(sorted((gene, tuple(alleles)) for gene, alleles in self.cat.genes.items()))
+        browser.setHtml(genotype_html(genetics, genetics.version, genotype))
+        layout.addWidget(browser)
         
         return widget
     
     def create_pedigree_tab(self):
         """Create family tree tab"""
         widget = QWidget()
-        widget.setStyleSheet("background-color: white;")
+        widget.setProperty("role", "tab-page")
         layout = QVBoxLayout()
         layout.setContentsMargins(20, 20, 20, 20)
         widget.setLayout(layout)
         
         registry = self.main_window.registry
         
-        # Parents section
-        parents_frame = QFrame()
-        parents_frame.setStyleSheet("""
-            QFrame {
-                background-color: #e8f5e9;
-                border-radius: 12px;
-                padding: 15px;
-            }
-        """)
-        parents_layout = QVBoxLayout()
-        parents_frame.setLayout(parents_layout)
-        
-        parents_title = QLabel("👨‍👩‍👧 Parents")
-        parents_title.setStyleSheet("font-size: 14pt; font-weight: bold; color: #2e7d32;")
-        parents_layout.addWidget(parents_title)
-        
-        # Sire
-        if self.cat.sire_id:
-            sire = registry.get_cat(self.cat.sire_id)
-            if sire:
-                sire_text = f"♂ Sire: #{sire.id}"
-                if sire.name:
-                    sire_text += f" - {sire.name}"
-                sire_label = QLabel(sire_text)
-                sire_label.setStyleSheet("font-size: 12pt; color: #1976d2; padding: 5px;")
-                parents_layout.addWidget(sire_label)
-        
-        # Dam
-        if self.cat.dam_id:
-            dam = registry.get_cat(self.cat.dam_id)
-            if dam:
-                dam_text = f"♀ Dam: #{dam.id}"
-                if dam.name:
-                    dam_text += f" - {dam.name}"
-                dam_label = QLabel(dam_text)
-                dam_label.setStyleSheet("font-size: 12pt; color: #c2185b; padding: 5px;")
-                parents_layout.addWidget(dam_label)
+        # Parents and offspring are each one rich text label instead of a label per cat
+        self._parents_label = QLabel(self.parents_html(registry))
+        self._parents_label.setStyleSheet(PARENTS_FRAME_QSS)
+        self._parents_label.setWordWrap(True)
+        layout.addWidget(self._parents_label)
         
-        if not self.cat.sire_id and not self.cat.dam_id:
-            no_parents = QLabel("No parents recorded (Founder)")
-            no_parents.setStyleSheet("color: #7f8c8d; font-style: italic;")
-            parents_layout.addWidget(no_parents)
-        
-        layout.addWidget(parents_frame)
-        
-        # Offspring section
-        offspring = registry.get_offspring(self.cat.id)
-        offspring_frame = QFrame()
-        offspring_frame.setStyleSheet("""
-            QFrame {
-                background-color: #fff3e0;
-                border-radius: 12px;
-                padding: 15px;
-                margin-top: 15px;
-            }
-        """)
-        offspring_layout = QVBoxLayout()
-        offspring_frame.setLayout(offspring_layout)
-        
-        offspring_title = QLabel(f"👶 Offspring ({len(offspring)})")
-        offspring_title.setStyleSheet("font-size: 14pt; font-weight: bold; color: #e65100;")
-        offspring_layout.addWidget(offspring_title)
-        
-        if offspring:
-            for child in offspring[:8]:
-                child_text = f"#{child.id}"
-                if child.name:
-                    child_text += f" - {child.name}"
-                child_text += f" ({child.sex})"
-                
-                child_label = QLabel(child_text)
-                child_label.setStyleSheet("font-size: 11pt; color: #424242; padding: 3px;")
-                offspring_layout.addWidget(child_label)
-            
-            if len(offspring) > 8:
-                more_label = QLabel(f"... and {len(offspring) - 8} more")
-                more_label.setStyleSheet("color: #7f8c8d; font-style: italic;")
-                offspring_layout.addWidget(more_label)
-        else:
-            no_offspring = QLabel("No offspring recorded")
-            no_offspring.setStyleSheet("color: #7f8c8d; font-style: italic;")
-            offspring_layout.addWidget(no_offspring)
-        
-        layout.addWidget(offspring_frame)
+        self._offspring = registry.get_offspring(self.cat.id)
+        self._offspring_label = QLabel(self.offspring_html())
+        self._offspring_label.setStyleSheet(OFFSPRING_FRAME_QSS)
+        self._offspring_label.setWordWrap(True)
+        self._offspring_label.linkActivated.connect(self.show_more_offspring)
+        layout.addWidget(self._offspring_label)
         
         # View pedigree button
         pedigree_btn = QPushButton("🌳 View Full Pedigree Chart")
         pedigree_btn.setMinimumHeight(45)
-        pedigree_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #4CAF50;
-                color: white;
-                font-size: 12pt;
-                font-weight: bold;
-                border-radius: 8px;
-                margin-top: 15px;
-            }
-            QPushButton:hover {
-                background-color: #45a049;
-            }
-        """)
+        pedigree_btn.setStyleSheet(PEDIGREE_BUTTON_QSS)
         pedigree_btn.clicked.connect(self.show_pedigree)
         layout.addWidget(pedigree_btn)
         
@@ -476,10 +592,44 @@ class ModernCatDetailsDialog(QDialog):
         
         return widget
     
+    def parents_html(self, registry):
+        """Build the rich text for the parents section"""
+        parts = [f'<div style="{FAMILY_TITLE_STYLE} color: #2e7d32;">👨‍👩‍👧 Parents</div>']
+        for parent_id, sign, role, color in ((self.cat.sire_id, "♂", "Sire", "#1976d2"),
+                                             (self.cat.dam_id, "♀", "Dam", "#c2185b")):
+            parent = registry.get_cat(parent_id) if parent_id else None
+            if parent:
+                parts.append(f'<p style="font-size: 12pt; color: {color};">'
+                             f'{sign} {role}: {escape(cat_label(parent))}</p>')
+        if not self.cat.sire_id and not self.cat.dam_id:
+            parts.append(f'<p style="{FAMILY_EMPTY_STYLE}">No parents recorded (Founder)</p>')
+        return "".join(parts)
+    
+    def offspring_html(self, show_all=False):
+        """Build the rich text for the offspring section"""
+        offspring = self._offspring
+        parts = [f'<div style="{FAMILY_TITLE_STYLE} color: #e65100;">👶 Offspring ({len(offspring)})</div>']
+        if not offspring:
+            parts.append(f'<p style="{FAMILY_EMPTY_STYLE}">No offspring recorded</p>')
+            return "".join(parts)
+        
+        shown = offspring if show_all else offspring[:OFFSPRING_PREVIEW]
+        parts.append('<p style="font-size: 11pt; color: #424242;">')
+        parts.append("<br>".join(f"{escape(cat_label(child))} ({child.sex})" for child in shown))
+        parts.append("</p>")
+        if len(shown) < len(offspring):
+            parts.append(f'<p><a href="more" style="{FAMILY_EMPTY_STYLE}">'
+                         f'Show {len(offspring) - len(shown)} more</a></p>')
+        return "".join(parts)
+    
+    def show_more_offspring(self, _link=None):
+        """Expand the offspring list to every child"""
+        self._offspring_label.setText(self.offspring_html(show_all=True))
+    
     def create_physical_tab(self):
         """Create physical traits visualization"""
         widget = QWidget()
-        widget.setStyleSheet("background-color: white;")
+        widget.setProperty("role", "tab-page")
         layout = QVBoxLayout()
         layout.setContentsMargins(20, 20, 20, 20)
         widget.setLayout(layout)
@@ -488,7 +638,7 @@ class ModernCatDetailsDialog(QDialog):
         build_frame = self.create_trait_meter(
             "Build Type",
             self.cat.build_value,
-            self.cat.get_build_phenotype(),
+            self._pheno.build_pheno,
             "#9b59b6"
         )
         layout.addWidget(build_frame)
@@ -497,14 +647,13 @@ class ModernCatDetailsDialog(QDialog):
         size_frame = self.create_trait_meter(
             "Size Category",
             self.cat.size_value,
-            self.cat.get_size_phenotype(),
+            self._pheno.size_pheno,
             "#f39c12"
         )
         layout.addWidget(size_frame)
         
         # White percentage meter
-        phenotype_calc = self.main_window.phenotype_calculator
-        white_pct = phenotype_calc.get_white_percentage(self.cat)
+        white_pct = self._pheno.white_pct
         white_frame = self.create_trait_meter(
             "White Markings",
             white_pct,
@@ -519,55 +668,36 @@ class ModernCatDetailsDialog(QDialog):
     
     def create_trait_meter(self, title, value, description, color):
         """Create a visual meter for a trait"""
-        frame = QFrame()
-        frame.setStyleSheet(f"""
-            QFrame {{
-                background-color: #f8f9fa;
-                border-radius: 12px;
-                border-left: 5px solid {color};
-                padding: 15px;
-                margin-bottom: 15px;
-            }}
-        """)
+        frame = decorative_frame()
+        frame.setProperty("role", "trait-meter")
+        frame.setProperty("accent", color)
         layout = QVBoxLayout()
         frame.setLayout(layout)
         
         # Title
         title_label = QLabel(title)
-        title_label.setStyleSheet(f"font-size: 12pt; font-weight: bold; color: {color};")
+        title_label.setProperty("role", "meter-title")
+        title_label.setProperty("accent", color)
         layout.addWidget(title_label)
         
-        # Progress bar
-        progress_bg = QFrame()
-        progress_bg.setFixedHeight(30)
-        progress_bg.setStyleSheet(f"""
-            QFrame {{
-                background-color: #ecf0f1;
-                border-radius: 15px;
-            }}
-        """)
-        
-        progress_fill = QFrame(progress_bg)
-        fill_width = int((value / 100) * progress_bg.width())
-        progress_fill.setGeometry(0, 0, fill_width, 30)
-        progress_fill.setStyleSheet(f"""
-            QFrame {{
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                    stop:0 {color}, stop:1 {self.lighten_color(color)});
-                border-radius: 15px;
-            }}
-        """)
-        
-        layout.addWidget(progress_bg)
+        # Progress bar; Qt sizes the chunk from the value at paint time
+        progress = QProgressBar()
+        progress.setRange(0, 100)
+        progress.setValue(max(0, min(100, int(value))))
+        progress.setTextVisible(False)
+        progress.setFixedHeight(30)
+        progress.setProperty("role", "trait-bar")
+        progress.setProperty("accent", color)
+        layout.addWidget(progress)
         
         # Value and description
         value_layout = QHBoxLayout()
         value_label = QLabel(f"{value}/100")
-        value_label.setStyleSheet("font-size: 11pt; font-weight: bold; color: #2c3e50;")
+        value_label.setProperty("role", "meter-value")
         value_layout.addWidget(value_label)
         
         desc_label = QLabel(description)
-        desc_label.setStyleSheet("font-size: 11pt; color: #7f8c8d;")
+        desc_label.setProperty("role", "meter-desc")
         value_layout.addWidget(desc_label)
         value_layout.addStretch()
         
@@ -575,39 +705,17 @@ class ModernCatDetailsDialog(QDialog):
         
         return frame
     
-    def lighten_color(self, hex_color):
-        """Lighten a hex color"""
-        # Simple lightening by mixing with white
-        return hex_color + "80"  # Add alpha for lighter appearance
-    
     def create_footer(self):
         """Create footer with action buttons"""
-        footer = QFrame()
-        footer.setStyleSheet("""
-            QFrame {
-                background-color: white;
-                border-top: 1px solid #bdc3c7;
-                padding: 15px;
-            }
-        """)
+        footer = decorative_frame()
+        footer.setStyleSheet(FOOTER_QSS)
         layout = QHBoxLayout()
         footer.setLayout(layout)
         
         # Edit button
         edit_btn = QPushButton("✏️ Edit Cat")
         edit_btn.setMinimumHeight(40)
-        edit_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #3498db;
-                color: white;
-                font-weight: bold;
-                border-radius: 6px;
-                padding: 0px 20px;
-            }
-            QPushButton:hover {
-                background-color: #2980b9;
-            }
-        """)
+        edit_btn.setStyleSheet(EDIT_BUTTON_QSS)
         edit_btn.clicked.connect(self.edit_cat)
         layout.addWidget(edit_btn)
         
@@ -617,17 +725,7 @@ class ModernCatDetailsDialog(QDialog):
         close_btn = QPushButton("Close")
         close_btn.setMinimumHeight(40)
         close_btn.setMinimumWidth(100)
-        close_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #95a5a6;
-                color: white;
-                font-weight: bold;
-                border-radius: 6px;
-            }
-            QPushButton:hover {
-                background-color: #7f8c8d;
-            }
-        """)
+        close_btn.setStyleSheet(CLOSE_BUTTON_QSS)
         close_btn.clicked.connect(self.accept)
         layout.addWidget(close_btn)
         
@@ -635,17 +733,7 @@ class ModernCatDetailsDialog(QDialog):
     
     def calculate_generation(self):
         """Calculate generation number"""
-        def get_gen(cat_id, depth=0):
-            if depth > 50:
-                return 0
-            cat = self.main_window.registry.get_cat(cat_id)
-            if not cat or (not cat.sire_id and not cat.dam_id):
-                return 0
-            sire_gen = get_gen(cat.sire_id, depth + 1) if cat.sire_id else 0
-            dam_gen = get_gen(cat.dam_id, depth + 1) if cat.dam_id else 0
-            return max(sire_gen, dam_gen) + 1
-        
-        return get_gen(self.cat.id)
+        return self.main_window.registry.get_generation(self.cat.id)
     
     def show_pedigree(self):
         """Show pedigree dialog"""
@@ -656,9 +744,7 @@ class ModernCatDetailsDialog(QDialog):
     def edit_cat(self):
         """Open cat editor"""
         from ui.dialogs.cat_editor_dialog import CatEditorDialog
-        dialog = CatEditorDialog(self.cat, self.main_window, self)
-        if dialog.exec():
-            self.accept()
-            # Reopen with updated data
-            new_dialog = ModernCatDetailsDialog(self.cat, self.main_window, self.parent())
-            new_dialog.exec()
\ No newline at end of file
+        dialog = CatEditorDialog.get_or_create(self.main_window)
+        if dialog.open_for(self.cat):
+            self.refresh()
+            self.main_window.registry_tab.schedule_refresh()
\ No newline at end of file
@@ -7,6 +7,55 @@ from PySide6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QTextEdit,
                                QPushButton, QLabel, QTabWidget, QWidget, QMessageBox)
 from PySide6.QtCore import Qt
 
+# The visual chart is optional; resolve it once at import instead of on every click
+try:
+    from ui.dialogs.visual_pedigree_dialog import VisualPedigreeDialog
+    VISUAL_IMPORT_ERROR = None
+except ImportError as e:
+    VisualPedigreeDialog = None
+    VISUAL_IMPORT_ERROR = e
+
+# Stylesheets, shared by every dialog instance
+TITLE_QSS = "font-size: 14pt; font-weight: bold;"
+OPEN_VISUAL_BUTTON_QSS = """
+    QPushButton {
+        background-color: #4CAF50;
+        color: white;
+        font-size: 14pt;
+        font-weight: bold;
+        border-radius: 8px;
+    }
+    QPushButton:hover {
+        background-color: #45a049;
+    }
+"""
+INFO_LABEL_QSS = """
+    padding: 20px;
+    background-color: #e3f2fd;
+    border-radius: 8px;
+    font-size: 11pt;
+    line-height: 1.5;
+"""
+
+# Text view section rules
+HEAVY_RULE = "=" * 100
+LIGHT_RULE = "-" * 100
+
+# Generations of ancestry shown in the text view
+PEDIGREE_GENERATIONS = 3
+
+# Great-grandparent Ahnentafel slots, paternal line first
+GREAT_GRANDPARENT_LABELS = (
+    (8, "Paternal Great-Grandsire (Sire's Sire's Sire)"),
+    (9, "Paternal Great-Granddam (Sire's Sire's Dam)"),
+    (10, "Paternal Great-Grandsire (Sire's Dam's Sire)"),
+    (11, "Paternal Great-Granddam (Sire's Dam's Dam)"),
+    (12, "Maternal Great-Grandsire (Dam's Sire's Sire)"),
+    (13, "Maternal Great-Granddam (Dam's Sire's Dam)"),
+    (14, "Maternal Great-Grandsire (Dam's Dam's Sire)"),
+    (15, "Maternal Great-Granddam (Dam's Dam's Dam)"),
+)
+
 
 class PedigreeDialog(QDialog):
     """Enhanced pedigree viewer with both text and visual modes"""
@@ -31,7 +80,7 @@ class PedigreeDialog(QDialog):
             title_text += f" - {self.cat.name}"
         
         title = QLabel(title_text)
-        title.setStyleSheet("font-size: 14pt; font-weight: bold;")
+        title.setStyleSheet(TITLE_QSS)
         layout.addWidget(title)
         
         # Create tabs for different views
@@ -41,9 +90,10 @@ class PedigreeDialog(QDialog):
         visual_tab = self.create_visual_tab()
         tabs.addTab(visual_tab, "🎨 Visual Chart")
         
-        # Text pedigree tab
+        # Text pedigree tab, filled in the first time it is shown
         text_tab = self.create_text_tab()
-        tabs.addTab(text_tab, "📝 Text View")
+        self._text_tab_index = tabs.addTab(text_tab, "📝 Text View")
+        tabs.currentChanged.connect(self._on_tab_changed)
         
         layout.addWidget(tabs)
         
@@ -64,18 +114,7 @@ class PedigreeDialog(QDialog):
         # Button to open full visual dialog
         open_visual_btn = QPushButton("🚀 Open Interactive Visual Pedigree")
         open_visual_btn.setMinimumHeight(60)
-        open_visual_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #4CAF50;
-                color: white;
-                font-size: 14pt;
-                font-weight: bold;
-                border-radius: 8px;
-            }
-            QPushButton:hover {
-                background-color: #45a049;
-            }
-        """)
+        open_visual_btn.setStyleSheet(OPEN_VISUAL_BUTTON_QSS)
         open_visual_btn.clicked.connect(self.open_visual_pedigree)
         
         layout.addStretch()
@@ -90,13 +129,7 @@ class PedigreeDialog(QDialog):
             "• Adjustable generation depth (3-6 generations)\n"
             "• Beautiful curved connection lines"
         )
-        info_label.setStyleSheet("""
-            padding: 20px;
-            background-color: #e3f2fd;
-            border-radius: 8px;
-            font-size: 11pt;
-            line-height: 1.5;
-        """)
+        info_label.setStyleSheet(INFO_LABEL_QSS)
         info_label.setWordWrap(True)
         layout.addWidget(info_label)
         
@@ -114,27 +147,44 @@ class PedigreeDialog(QDialog):
         self.text_edit.setReadOnly(True)
         self.text_edit.setFontFamily("Courier")
         layout.addWidget(self.text_edit)
-        
-        # Generate text pedigree
-        pedigree_text = self.build_text_pedigree()
-        self.text_edit.setPlainText(pedigree_text)
+        self._text_built = False
         
         return widget
     
+    def _on_tab_changed(self, idx):
+        """Generate the text pedigree on first view of its tab"""
+        if idx == self._text_tab_index and not self._text_built:
+            self._text_built = True
+            self.text_edit.setPlainText(self.cached_text_pedigree())
+    
+    def cached_text_pedigree(self):
+        """Get the text pedigree, reusing the last one built while nothing has changed"""
+        main_window = self.main_window
+        version = (main_window.registry.version, main_window.genetics_engine.version)
+        cache = main_window._pedigree_text_cache
+        if main_window._pedigree_text_version != version:
+            cache.clear()
+            main_window._pedigree_text_version = version
+        
+        text = cache.get(self.cat.id)
+        if text is None:
+            text = cache[self.cat.id] = self.build_text_pedigree()
+        return text
+    
     def open_visual_pedigree(self):
         """Open the full visual pedigree dialog"""
-        try:
-            from ui.dialogs.visual_pedigree_dialog import VisualPedigreeDialog
-            dialog = VisualPedigreeDialog(self.cat, self.main_window, self)
-            dialog.exec()
-        except ImportError as e:
+        if VisualPedigreeDialog is None:
             QMessageBox.warning(
                 self,
                 "Feature Unavailable",
                 f"Visual pedigree module not found.\n\n"
                 f"Please ensure visual_pedigree_dialog.py is in ui/dialogs/\n\n"
-                f"Error: {e}"
+                f"Error: {VISUAL_IMPORT_ERROR}"
             )
+            return
+        
+        dialog = VisualPedigreeDialog(self.cat, self.main_window, self)
+        dialog.exec()
     
     def build_text_pedigree(self):
         """Build text pedigree chart"""
@@ -144,144 +194,63 @@ class PedigreeDialog(QDialog):
         registry = self.main_window.registry
         phenotype_calc = self.main_window.phenotype_calculator
         
-        def get_cat_info(cat_id):
-            if cat_id and cat_id in registry:
-                cat = registry.get_cat(cat_id)
+        # An ancestor can fill several slots in an inbred pedigree; describe it once
+        cat_info = {}
+        
+        def get_cat_info(cat):
+            info = cat_info.get(cat.id)
+            if info is None:
                 name = cat.name if cat.name else f"Cat #{cat.id}"
                 phenotype = phenotype_calc.calculate_phenotype(cat)
-                return f"#{cat.id} {name}\n{phenotype}"
-            return "Unknown"
-        
-        def get_ancestors(cat_obj, generation):
-            if generation == 0 or not cat_obj:
-                return None
-            
-            sire = registry.get_cat(cat_obj.sire_id) if cat_obj.sire_id else None
-            dam = registry.get_cat(cat_obj.dam_id) if cat_obj.dam_id else None
-            
-            return {
-                'sire': sire,
-                'dam': dam,
-                'sire_ancestors': get_ancestors(sire, generation - 1) if sire else None,
-                'dam_ancestors': get_ancestors(dam, generation - 1) if dam else None
-            }
-        
-        pedigree = get_ancestors(self.cat, 4)
-        
-        lines = []
-        lines.append(f"Subject: {get_cat_info(self.cat.id)}")
-        lines.append("=" * 100)
-        lines.append("")
-        
-        if not pedigree:
-            return "\n".join(lines) + "\nNo pedigree information available."
-        
-        # Parents
-        lines.append("PARENTS:")
-        lines.append("-" * 100)
-        
-        if pedigree['sire']:
-            lines.append(f"Sire:  {get_cat_info(pedigree['sire'].id)}")
-        else:
-            lines.append("Sire:  Unknown")
-        
-        lines.append("")
-        
-        if pedigree['dam']:
-            lines.append(f"Dam:   {get_cat_info(pedigree['dam'].id)}")
-        else:
-            lines.append("Dam:   Unknown")
-        
-        lines.append("")
-        lines.append("")
-        
-        # Grandparents
-        lines.append("GRANDPARENTS:")
-        lines.append("-" * 100)
-        
-        sire_anc = pedigree.get('sire_ancestors')
-        dam_anc = pedigree.get('dam_ancestors')
-        
-        if sire_anc:
-            if sire_anc['sire']:
-                lines.append(f"Paternal Grandsire: {get_cat_info(sire_anc['sire'].id)}")
-            else:
-                lines.append("Paternal Grandsire: Unknown")
-            
-            lines.append("")
-            
-            if sire_anc['dam']:
-                lines.append(f"Paternal Granddam:  {get_cat_info(sire_anc['dam'].id)}")
-            else:
-                lines.append("Paternal Granddam:  Unknown")
+                info = cat_info[cat.id] = f"#{cat.id} {name}\n{phenotype}"
+            return info
+        
+        # Ahnentafel slots: 1 is the subject, the sire of slot n is 2n and its dam 2n + 1.
+        # Each generation is fetched with one bulk lookup.
+        pedigree = [None] * (2 << PEDIGREE_GENERATIONS)
+        pedigree[1] = self.cat
+        level = [1]
+        for _ in range(PEDIGREE_GENERATIONS):
+            wanted = {}
+            for slot in level:
+                cat = pedigree[slot]
+                if cat.sire_id:
+                    wanted[2 * slot] = cat.sire_id
+                if cat.dam_id:
+                    wanted[2 * slot + 1] = cat.dam_id
+            found = registry.get_cats(wanted.values())
+            level = []
+            for slot, cat_id in wanted.items():
+                if cat_id in found:
+                    pedigree[slot] = found[cat_id]
+                    level.append(slot)
+        
+        coefficient = self.main_window.app.inbreeding_calculator.calculate_coefficient(self.cat.id)
+        
+        def slot_line(label, slot):
+            cat = pedigree[slot]
+            return f"{label}{get_cat_info(cat)}" if cat else f"{label}Unknown"
+        
+        lines = [
+            f"Subject: {get_cat_info(self.cat)}\nInbreeding coefficient: {coefficient:.4f}\n{HEAVY_RULE}\n",
+            f"PARENTS:\n{LIGHT_RULE}\n{slot_line('Sire:  ', 2)}\n\n{slot_line('Dam:   ', 3)}\n\n",
+            f"GRANDPARENTS:\n{LIGHT_RULE}",
+        ]
+        
+        if pedigree[2]:
+            lines.append(f"{slot_line('Paternal Grandsire: ', 4)}\n\n{slot_line('Paternal Granddam:  ', 5)}\n")
         else:
-            lines.append("Paternal Grandparents: Unknown")
+            lines.append("Paternal Grandparents: Unknown\n")
         
-        lines.append("")
-        
-        if dam_anc:
-            if dam_anc['sire']:
-                lines.append(f"Maternal Grandsire: {get_cat_info(dam_anc['sire'].id)}")
-            else:
-                lines.append("Maternal Grandsire: Unknown")
-            
-            lines.append("")
-            
-            if dam_anc['dam']:
-                lines.append(f"Maternal Granddam:  {get_cat_info(dam_anc['dam'].id)}")
-            else:
-                lines.append("Maternal Granddam:  Unknown")
+        if pedigree[3]:
+            lines.append(f"{slot_line('Maternal Grandsire: ', 6)}\n\n{slot_line('Maternal Granddam:  ', 7)}\n\n")
         else:
-            lines.append("Maternal Grandparents: Unknown")
-        
-        lines.append("")
-        lines.append("")
+            lines.append("Maternal Grandparents: Unknown\n\n")
         
         # Great-grandparents (simplified)
-        lines.append("GREAT-GRANDPARENTS:")
-        lines.append("-" * 100)
-        
-        gg_count = 0
-        
-        if sire_anc:
-            if sire_anc.get('sire_ancestors'):
-                ssa = sire_anc['sire_ancestors']
-                if ssa['sire']:
-                    lines.append(f"  #{ssa['sire'].id} - Paternal Great-Grandsire (Sire's Sire's Sire)")
-                    gg_count += 1
-                if ssa['dam']:
-                    lines.append(f"  #{ssa['dam'].id} - Paternal Great-Granddam (Sire's Sire's Dam)")
-                    gg_count += 1
-            
-            if sire_anc.get('dam_ancestors'):
-                sda = sire_anc['dam_ancestors']
-                if sda['sire']:
-                    lines.append(f"  #{sda['sire'].id} - Paternal Great-Grandsire (Sire's Dam's Sire)")
-                    gg_count += 1
-                if sda['dam']:
-                    lines.append(f"  #{sda['dam'].id} - Paternal Great-Granddam (Sire's Dam's Dam)")
-                    gg_count += 1
-        
-        if dam_anc:
-            if dam_anc.get('sire_ancestors'):
-                dsa = dam_anc['sire_ancestors']
-                if dsa['sire']:
-                    lines.append(f"  #{dsa['sire'].id} - Maternal Great-Grandsire (Dam's Sire's Sire)")
-                    gg_count += 1
-                if dsa['dam']:
-                    lines.append(f"  #{dsa['dam'].id} - Maternal Great-Granddam (Dam's Sire's Dam)")
-                    gg_count += 1
-            
-            if dam_anc.get('dam_ancestors'):
-                dda = dam_anc['dam_ancestors']
-                if dda['sire']:
-                    lines.append(f"  #{dda['sire'].id} - Maternal Great-Grandsire (Dam's Dam's Sire)")
-                    gg_count += 1
-                if dda['dam']:
-                    lines.append(f"  #{dda['dam'].id} - Maternal Great-Granddam (Dam's Dam's Dam)")
-                    gg_count += 1
-        
-        if gg_count == 0:
-            lines.append("  No great-grandparent information available")
+        lines.append(f"GREAT-GRANDPARENTS:\n{LIGHT_RULE}")
+        great_grandparents = [f"  #{pedigree[slot].id} - {label}"
+                              for slot, label in GREAT_GRANDPARENT_LABELS if pedigree[slot]]
+        lines.extend(great_grandparents or ["  No great-grandparent information available"])
         
-        return "\n".join(lines)
\ No newline at end of file
+        return "\n".join(lines)
@@ -5,14 +5,36 @@ Place this file as: ui/dialogs/visual_pedigree_dialog.py
 
 from PySide6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QPushButton, 
                                QGraphicsView, QGraphicsScene, QGraphicsItem,
-                               QGraphicsRectItem, QGraphicsTextItem, QLabel,
+                               QGraphicsRectItem, QLabel,
                                QComboBox, QFileDialog, QMessageBox, QGraphicsEllipseItem)
 from PySide6.QtCore import Qt, QRectF, QPointF
 from PySide6.QtGui import (QPainter, QColor, QPen, QBrush, QLinearGradient, 
                           QFont, QPainterPath, QPixmap)
+from collections import deque
+from functools import lru_cache
 from typing import Dict
 
 
+# Chart layout: subject position and the gaps between generations and between parents
+SUBJECT_X = 50
+SUBJECT_Y = 400
+HORIZONTAL_SPACING = 250
+VERTICAL_SPACING = 120
+
+# Text inset, matching the document margin of the QGraphicsTextItems nodes used to have
+TEXT_MARGIN = 4
+
+# Nodes this far outside the viewport stay visible so panning never reveals a gap
+CULL_MARGIN = 64
+
+
+@lru_cache(maxsize=None)
+def node_fonts():
+    """Fonts for a node's ID, phenotype, sex and eye color text"""
+    return (QFont("Arial", 10, QFont.Bold), QFont("Arial", 8),
+            QFont("Arial", 16, QFont.Bold), QFont("Arial", 7))
+
+
 class CatNode(QGraphicsRectItem):
     """Graphical node representing a cat in the pedigree"""
     
@@ -35,6 +57,9 @@ class CatNode(QGraphicsRectItem):
         self.setFlag(QGraphicsItem.ItemIsSelectable)
         self.setAcceptHoverEvents(True)
         
+        # Paint into a device-resolution pixmap once; Qt re-renders it only on update() or zoom
+        self.setCacheMode(QGraphicsItem.DeviceCoordinateCache)
+        
         # Create visual elements
         self.setup_appearance()
         self.create_text_items()
@@ -57,65 +82,52 @@ class CatNode(QGraphicsRectItem):
         
         self.setBrush(QBrush(gradient))
         self.setPen(QPen(QColor(60, 60, 60), 2))
+        
+        self.path = QPainterPath()
+        self.path.addRoundedRect(self.rect(), 10, 10)
     
     def create_text_items(self):
-        """Create text elements within the node"""
+        """Prepare the text drawn within the node as (x, y, font, color, text)"""
+        # Cached on the cat, so repeated ancestors and rebuilds reuse the results
+        phenotype, eye_color = self.phenotype_calc.phenotype_and_eye_color(self.cat)
+        id_font, pheno_font, sex_font, eye_font = node_fonts()
+        
         # Cat ID and name
-        self.id_text = QGraphicsTextItem(self)
         id_str = f"#{self.cat.id}"
         if self.cat.name:
             id_str += f" - {self.cat.name[:15]}"
-        self.id_text.setPlainText(id_str)
-        self.id_text.setPos(5, 5)
-        
-        font = QFont("Arial", 10, QFont.Bold)
-        self.id_text.setFont(font)
-        self.id_text.setDefaultTextColor(QColor(40, 40, 40))
         
         # Phenotype (shortened)
-        self.pheno_text = QGraphicsTextItem(self)
-        phenotype = self.phenotype_calc.calculate_phenotype(self.cat)
         if len(phenotype) > 25:
             phenotype = phenotype[:22] + "..."
-        self.pheno_text.setPlainText(phenotype)
-        self.pheno_text.setPos(5, 28)
         
-        pheno_font = QFont("Arial", 8)
-        self.pheno_text.setFont(pheno_font)
-        self.pheno_text.setDefaultTextColor(QColor(60, 60, 60))
-        
-        # Sex indicator
-        self.sex_text = QGraphicsTextItem(self)
+        # Sex and eye color indicators
         sex_symbol = "♂" if self.cat.sex == 'male' else "♀"
-        self.sex_text.setPlainText(sex_symbol)
-        self.sex_text.setPos(self.node_width - 25, 5)
-        
-        sex_font = QFont("Arial", 16, QFont.Bold)
-        self.sex_text.setFont(sex_font)
-        self.sex_text.setDefaultTextColor(QColor(40, 40, 40))
-        
-        # Eye color indicator
-        self.eye_text = QGraphicsTextItem(self)
-        eye_color = self.phenotype_calc.calculate_eye_color(self.cat)
         eye_short = eye_color.split()[0] if eye_color else "Eyes"
-        self.eye_text.setPlainText(f"👁 {eye_short}")
-        self.eye_text.setPos(5, 50)
         
-        eye_font = QFont("Arial", 7)
-        self.eye_text.setFont(eye_font)
-        self.eye_text.setDefaultTextColor(QColor(80, 80, 80))
+        self.text_items = (
+            (5, 5, id_font, QColor(40, 40, 40), id_str),
+            (5, 28, pheno_font, QColor(60, 60, 60), phenotype),
+            (self.node_width - 25, 5, sex_font, QColor(40, 40, 40), sex_symbol),
+            (5, 50, eye_font, QColor(80, 80, 80), f"👁 {eye_short}"),
+        )
     
     def paint(self, painter, option, widget):
-        """Custom paint for rounded corners"""
+        """Custom paint for rounded corners and text"""
         painter.setRenderHint(QPainter.Antialiasing)
-        
-        path = QPainterPath()
-        path.addRoundedRect(self.rect(), 10, 10)
+        path = self.path
         
         painter.fillPath(path, self.brush())
         painter.setPen(self.pen())
         painter.drawPath(path)
         
+        # Text is drawn here rather than by child items, so it shares the node's cache
+        for x, y, font, color, text in self.text_items:
+            painter.setFont(font)
+            painter.setPen(color)
+            painter.drawText(QRectF(x + TEXT_MARGIN, y + TEXT_MARGIN, self.node_width - x, self.node_height - y),
+                             Qt.AlignLeft | Qt.AlignTop, text)
+        
         if self.isSelected():
             highlight_pen = QPen(QColor(255, 215, 0), 3)
             painter.setPen(highlight_pen)
@@ -184,6 +196,41 @@ class PedigreeConnection(QGraphicsItem):
         painter.drawPath(path)
 
 
+class PedigreeView(QGraphicsView):
+    """Graphics view that hides nodes scrolled or zoomed out of sight"""
+    
+    def __init__(self, scene):
+        super().__init__(scene)
+        self.nodes = []
+    
+    def set_nodes(self, nodes):
+        """Track the nodes to cull and apply culling for the current viewport"""
+        self.nodes = nodes
+        self.update_culling()
+    
+    def update_culling(self):
+        """Show only the nodes near the visible part of the scene"""
+        visible = self.mapToScene(self.viewport().rect()).boundingRect().adjusted(
+            -CULL_MARGIN, -CULL_MARGIN, CULL_MARGIN, CULL_MARGIN)
+        for node in self.nodes:
+            node.setVisible(visible.intersects(node.sceneBoundingRect()))
+    
+    def show_all_nodes(self):
+        """Make every node visible, e.g. before rendering the whole scene"""
+        for node in self.nodes:
+            node.setVisible(True)
+    
+    def scrollContentsBy(self, dx, dy):
+        """Re-cull after panning"""
+        super().scrollContentsBy(dx, dy)
+        self.update_culling()
+    
+    def resizeEvent(self, event):
+        """Re-cull after the viewport changes size"""
+        super().resizeEvent(event)
+        self.update_culling()
+
+
 class VisualPedigreeDialog(QDialog):
     """Interactive visual pedigree chart dialog"""
     
@@ -230,9 +277,10 @@ class VisualPedigreeDialog(QDialog):
         
         layout.addLayout(header_layout)
         
-        # Graphics view
+        # Graphics view; a pedigree is a few hundred static items, too few to benefit from a BSP index
         self.scene = QGraphicsScene()
-        self.view = QGraphicsView(self.scene)
+        self.scene.setItemIndexMethod(QGraphicsScene.NoIndex)
+        self.view = PedigreeView(self.scene)
         self.view.setRenderHint(QPainter.Antialiasing)
         self.view.setDragMode(QGraphicsView.ScrollHandDrag)
         self.view.setStyleSheet("background-color: #ecf0f1; border: 1px solid #bdc3c7;")
@@ -276,31 +324,47 @@ class VisualPedigreeDialog(QDialog):
     
     def build_pedigree(self):
         """Build the pedigree tree"""
+        self.view.set_nodes([])
         self.scene.clear()
         self.cat_nodes.clear()
         
         generations = int(self.gen_combo.currentText())
         
-        vertical_spacing = 120
-        horizontal_spacing = 250
-        
-        subject_node = self.create_cat_node(
-            self.cat, 
-            generation=0,
-            x=50,
-            y=400
-        )
-        
-        self.build_ancestors(
-            subject_node,
-            generation=1,
-            max_gen=generations,
-            base_x=50 + horizontal_spacing,
-            vertical_spacing=vertical_spacing
-        )
+        # Lay the whole tree out first, then add every item to the scene in one pass
+        nodes = []
+        for cat, generation, x, y, child_index, is_sire in self.layout_ancestors(generations):
+            node = self.create_cat_node(cat, generation, x, y)
+            nodes.append(node)
+            if child_index is not None:
+                self.scene.addItem(PedigreeConnection(node, nodes[child_index], is_sire))
         
+        self.view.nodes = nodes
         self.center_view()
     
+    def layout_ancestors(self, max_gen):
+        """Place the cat and its ancestors breadth-first as (cat, generation, x, y, child index, is sire)"""
+        get_cat = self.registry.get_cat
+        placed = [(self.cat, 0, SUBJECT_X, SUBJECT_Y, None, False)]
+        queue = deque([0])
+        
+        while queue:
+            index = queue.popleft()
+            cat, generation, x, y = placed[index][:4]
+            if generation == max_gen:
+                continue
+            
+            # Parents fan out by half as much each generation
+            spacing = VERTICAL_SPACING / (2 ** generation)
+            for parent_id, offset, is_sire in ((cat.sire_id, -spacing, True),
+                                               (cat.dam_id, spacing, False)):
+                parent = get_cat(parent_id) if parent_id else None
+                if parent:
+                    placed.append((parent, generation + 1, x + HORIZONTAL_SPACING,
+                                   y + offset, index, is_sire))
+                    queue.append(len(placed) - 1)
+        
+        return placed
+    
     def create_cat_node(self, cat, generation, x, y):
         """Create a cat node and add to scene"""
         node = CatNode(cat, self.phenotype_calc, self.registry, generation, x, y)
@@ -309,36 +373,6 @@ class VisualPedigreeDialog(QDialog):
         self.cat_nodes[cat.id] = node
         return node
     
-    def build_ancestors(self, child_node, generation, max_gen, base_x, vertical_spacing):
-        """Recursively build ancestor tree"""
-        if generation > max_gen:
-            return
-        
-        cat = child_node.cat
-        current_spacing = vertical_spacing / (2 ** (generation - 1))
-        child_y = child_node.scenePos().y()
-        
-        sire_y = child_y - current_spacing
-        dam_y = child_y + current_spacing
-        
-        if cat.sire_id and cat.sire_id in self.registry:
-            sire = self.registry.get_cat(cat.sire_id)
-            sire_node = self.create_cat_node(sire, generation, base_x, sire_y)
-            
-            connection = PedigreeConnection(sire_node, child_node, is_sire=True)
-            self.scene.addItem(connection)
-            
-            self.build_ancestors(sire_node, generation + 1, max_gen, base_x + 250, vertical_spacing)
-        
-        if cat.dam_id and cat.dam_id in self.registry:
-            dam = self.registry.get_cat(cat.dam_id)
-            dam_node = self.create_cat_node(dam, generation, base_x, dam_y)
-            
-            connection = PedigreeConnection(dam_node, child_node, is_sire=False)
-            self.scene.addItem(connection)
-            
-            self.build_ancestors(dam_node, generation + 1, max_gen, base_x + 250, vertical_spacing)
-    
     def rebuild_pedigree(self):
         """Rebuild pedigree when generation count changes"""
         self.build_pedigree()
@@ -347,6 +381,7 @@ class VisualPedigreeDialog(QDialog):
         """Center and fit the view"""
         self.view.fitInView(self.scene.sceneRect(), Qt.KeepAspectRatio)
         self.view.scale(0.9, 0.9)
+        self.view.update_culling()
     
     def on_node_double_clicked(self, cat_id):
         """Handle node double click"""
@@ -358,9 +393,7 @@ class VisualPedigreeDialog(QDialog):
         if self.selected_cat_id:
             cat = self.registry.get_cat(self.selected_cat_id)
             if cat:
-                from ui.dialogs.cat_details_dialog import CatDetailsDialog
-                dialog = CatDetailsDialog(cat, self.main_window, self)
-                dialog.exec()
+                self.main_window.show_cat_details(cat, self)
     
     def export_image(self):
         """Export pedigree as image"""
@@ -376,10 +409,13 @@ class VisualPedigreeDialog(QDialog):
             pixmap = QPixmap(int(rect.width()), int(rect.height()))
             pixmap.fill(Qt.white)
             
+            # The export covers the whole chart, including nodes culled from the view
+            self.view.show_all_nodes()
             painter = QPainter(pixmap)
             painter.setRenderHint(QPainter.Antialiasing)
             self.scene.render(painter)
             painter.end()
+            self.view.update_culling()
             
             if pixmap.save(filename):
                 QMessageBox.information(self, "Export Successful", f"Pedigree exported to:\n{filename}")
@@ -389,4 +425,5 @@ class VisualPedigreeDialog(QDialog):
     def wheelEvent(self, event):
         """Handle mouse wheel for zoom"""
         factor = 1.15 if event.angleDelta().y() > 0 else 1 / 1.15
-        self.view.scale(factor, factor)
\ No newline at end of file
+        self.view.scale(factor, factor)
+        self.view.update_culling()
\ No newline at end of file
@@ -135,20 +135,13 @@ class GenerationTab(QWidget):
     def generate_random_genes(self, sex: str) -> dict:
         """Generate random genetic makeup"""
         genes = {}
-        genetics = self.main_window.genetics_engine
+        choices = random.choices
+        is_male = sex == 'male'
         
-        for gene_name, gene_data in genetics.genes.items():
-            alleles = gene_data['alleles']
-            weights = [gene_data['weights'].get(a, 1) for a in alleles]
-            
-            is_x_linked = gene_data.get('x_linked', False)
-            
-            if is_x_linked and sex == 'male':
-                genes[gene_name] = [random.choices(alleles, weights=weights)[0]]
-            else:
-                a1 = random.choices(alleles, weights=weights)[0]
-                a2 = random.choices(alleles, weights=weights)[0]
-                genes[gene_name] = [a1, a2]
+        # Cumulative weights are prepared once per gene data version; one draw per gene
+        for gene_name, alleles, cum_weights, is_x_linked in self.main_window.genetics_engine.get_sampling_tables():
+            k = 1 if is_x_linked and is_male else 2
+            genes[gene_name] = choices(alleles, cum_weights=cum_weights, k=k)
         
         return genes
     
@@ -183,14 +176,13 @@ class GenerationTab(QWidget):
                 display_name = gene_info['name']
                 
                 if len(alleles) == 1:
-                    desc = genetics.get_allele_description(gene_name, alleles[0])
+                    desc = genetics.describe_alleles(gene_name, (alleles[0],))
                     text += f"{display_name:20} {alleles[0]:8} ({desc})\n"
                 else:
                     dom = gene_info.get('dominance', {})
                     sorted_alleles = sorted(alleles, key=lambda a: dom.get(a, 0), reverse=True)
-                    desc1 = genetics.get_allele_description(gene_name, sorted_alleles[0])
-                    desc2 = genetics.get_allele_description(gene_name, sorted_alleles[1])
-                    text += f"{display_name:20} {sorted_alleles[0]}/{sorted_alleles[1]:8} ({desc1}, {desc2})\n"
+                    desc = genetics.describe_alleles(gene_name, tuple(sorted_alleles))
+                    text += f"{display_name:20} {sorted_alleles[0]}/{sorted_alleles[1]:8} ({desc})\n"
         
         text += "\n" + "=" * 80 + "\n"
         text += "✓ Ready to save to registry!\n"
@@ -47,6 +47,14 @@ class MainWindow(QMainWindow):
         self.cat_service = app.cat_service
         self.breeding_service = app.breeding_service
         
+        # Cat details and editor dialogs, created on first use and reused afterwards
+        self._details_dialog = None
+        self._cat_editor_dialog = None
+        
+        # Text pedigrees by cat ID, valid for one registry and gene data version
+        self._pedigree_text_cache = {}
+        self._pedigree_text_version = None
+        
         # Setup window
         self.setWindowTitle(f"{app.config.app_name} v{app.config.version}")
         self.setGeometry(100, 100, app.config.ui.window_width, app.config.ui.window_height)
@@ -240,7 +248,7 @@ class MainWindow(QMainWindow):
     
     def on_registry_changed(self, event):
         """Handle registry changes (event-driven)"""
-        self.registry_tab.refresh_table()
+        self.registry_tab.schedule_refresh()
         self.update_statusbar()
     
     def on_registry_loaded(self, event):
@@ -483,6 +491,21 @@ class MainWindow(QMainWindow):
                 f"Could not calculate statistics:\n{str(e)}\n\nCheck logs for details."
             )
     
+    def show_cat_details(self, cat, parent=None):
+        """Show the details dialog for a cat, reusing one dialog between opens"""
+        from ui.dialogs.cat_details_dialog import CatDetailsDialog
+        
+        if self._details_dialog is None:
+            self._details_dialog = CatDetailsDialog(cat, self, self)
+        elif self._details_dialog.isVisible():
+            # Opened from within the shared dialog (e.g. its pedigree chart)
+            CatDetailsDialog(cat, self, parent or self).exec()
+            return
+        else:
+            self._details_dialog.bind(cat)
+        
+        self._details_dialog.exec()
+    
     def show_preferences(self):
         """Show preferences dialog"""
         # TODO: Implement preferences dialog
@@ -634,13 +657,13 @@ QLineEdit:focus, QTextEdit:focus, QPlainTextEdit:focus {
     border: 2px solid #4CAF50;
 }
 
-QTableWidget {
+QTableWidget, QTableView {
     gridline-color: #e0e0e0;
     border: 1px solid #cccccc;
     background-color: white;
 }
 
-QTableWidget::item:selected {
+QTableWidget::item:selected, QTableView::item:selected {
     background-color: #4CAF50;
     color: white;
 }
@@ -5,7 +5,7 @@ Registry tab - displays all cats in a searchable table
 from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QTableWidget,
                                QTableWidgetItem, QPushButton, QLineEdit, QLabel,
                                QComboBox, QCheckBox, QGroupBox, QMessageBox)
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QTimer
 from ui.dialogs.cat_details_dialog import CatDetailsDialog
 from ui.dialogs.cat_editor_dialog import CatEditorDialog
 from ui.dialogs.pedigree_dialog import PedigreeDialog
@@ -17,6 +17,13 @@ class RegistryTab(QWidget):
     def __init__(self, main_window):
         super().__init__()
         self.main_window = main_window
+        
+        # Coalesce bursts of registry changes into a single table rebuild
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(50)
+        self._refresh_timer.timeout.connect(self.refresh_table)
+        
         self.setup_ui()
         self.refresh_table()
     
@@ -129,23 +136,31 @@ class RegistryTab(QWidget):
         button_layout.addStretch()
         layout.addLayout(button_layout)
     
+    def schedule_refresh(self):
+        """Refresh the table once the current burst of changes settles"""
+        self._refresh_timer.start()
+    
     def refresh_table(self):
         """Refresh the table with all cats"""
+        self._refresh_timer.stop()
         self.table.setSortingEnabled(False)
         self.table.setRowCount(0)
         
         registry = self.main_window.registry
         phenotype_calc = self.main_window.phenotype_calculator
+        cats = sorted(registry.cats.values(), key=lambda c: c.id)
+        pheno = phenotype_calc.calculate_phenotypes(cats)
+        eye_colors = phenotype_calc.calculate_eye_colors(cats)
         
-        for cat in sorted(registry.cats.values(), key=lambda c: c.id):
+        for cat, eye_color in zip(cats, eye_colors):
             row = self.table.rowCount()
             self.table.insertRow(row)
             
             self.table.setItem(row, 0, QTableWidgetItem(str(cat.id)))
             self.table.setItem(row, 1, QTableWidgetItem(cat.name))
             self.table.setItem(row, 2, QTableWidgetItem(cat.sex.capitalize()))
-            self.table.setItem(row, 3, QTableWidgetItem(phenotype_calc.calculate_phenotype(cat)))
-            self.table.setItem(row, 4, QTableWidgetItem(phenotype_calc.calculate_eye_color(cat)))
+            self.table.setItem(row, 3, QTableWidgetItem(pheno[cat.id]))
+            self.table.setItem(row, 4, QTableWidgetItem(eye_color))
             self.table.setItem(row, 5, QTableWidgetItem(cat.get_build_phenotype()))
             self.table.setItem(row, 6, QTableWidgetItem(cat.get_size_phenotype()))
         
@@ -231,9 +246,7 @@ class RegistryTab(QWidget):
             return
         
         cat = self.main_window.registry.get_cat(cat_id)
-        from ui.dialogs.cat_details_dialog import CatDetailsDialog
-        dialog = CatDetailsDialog(cat, self.main_window, self)
-        dialog.exec()
+        self.main_window.show_cat_details(cat, self)
     
     def view_pedigree(self):
         """View pedigree of selected cat"""
@@ -248,8 +261,8 @@ class RegistryTab(QWidget):
     
     def add_cat(self):
         """Add a new cat"""
-        dialog = CatEditorDialog(None, self.main_window, self)
-        if dialog.exec():
+        dialog = CatEditorDialog.get_or_create(self.main_window)
+        if dialog.open_for(None):
             self.refresh_table()
     
     def edit_cat(self):
@@ -260,8 +273,8 @@ class RegistryTab(QWidget):
             return
         
         cat = self.main_window.registry.get_cat(cat_id)
-        dialog = CatEditorDialog(cat, self.main_window, self)
-        if dialog.exec():
+        dialog = CatEditorDialog.get_or_create(self.main_window)
+        if dialog.open_for(cat):
             self.refresh_table()
     
     def delete_cat(self):
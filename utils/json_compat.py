@@ -0,0 +1,26 @@
+﻿"""
+JSON helpers - uses orjson when installed, stdlib json otherwise
+"""
+
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+if orjson is not None:
+    JSONDecodeError = orjson.JSONDecodeError
+    loads = orjson.loads
+    
+    def dumps(obj, indent: bool = False) -> str:
+        """Serialize obj to a JSON string"""
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0).decode()
+else:
+    JSONDecodeError = json.JSONDecodeError
+    loads = json.loads
+    
+    def dumps(obj, indent: bool = False) -> str:
+        """Serialize obj to a JSON string"""
+        return json.dumps(obj, indent=2 if indent else None)